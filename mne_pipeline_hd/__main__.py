@@ -6,14 +6,13 @@ Github: https://github.com/marsipu/mne-pipeline-hd
 """
 
 import os
-import re
 import sys
 from importlib import resources
 from os.path import join
 
 import qtpy
 from qtpy.QtCore import QTimer, Qt
-from qtpy.QtGui import QIcon, QFont
+from qtpy.QtGui import QIcon, QFont, QPalette
 from qtpy.QtWidgets import QApplication
 
 import mne_pipeline_hd
@@ -105,21 +104,23 @@ def main():
     if app_style not in ["dark", "light", "auto"]:
         app_style = "auto"
 
-    qdarktheme.setup_theme(app_style)
-    st = qdarktheme.load_stylesheet(app_style)
-    is_dark = "background:rgba(32, 33, 36, 1.000)" in st
+    # Determine the theme before applying it, so that the stylesheet
+    # is only built and applied once
+    # (the palette resolves "auto" with the system-theme like setup_theme)
+    palette = qdarktheme.load_palette(app_style)
+    is_dark = palette.color(QPalette.ColorRole.Window).lightness() < 128
     if is_dark:
         icon_name = "mne_pipeline_icon_dark.png"
         # Fix ToolTip-Problem on Windows
         # https://github.com/5yutan5/PyQtDarkTheme/issues/239
         if iswin:
-            match = re.search(r"QToolTip \{([^\{\}]+)\}", st)
-            if match is not None:
-                replace_str = "QToolTip {" + match.group(1) + ";border: 0px}"
-                st = st.replace(match.group(0), replace_str)
-                QApplication.instance().setStyleSheet(st)
+            additional_qss = "QToolTip {border: 0px}"
+        else:
+            additional_qss = None
     else:
         icon_name = "mne_pipeline_icon_light.png"
+        additional_qss = None
+    qdarktheme.setup_theme(app_style, additional_qss=additional_qss)
 
     icon_path = join(resources.files(mne_pipeline_hd.extra), icon_name)
     app_icon = QIcon(str(icon_path))
@@ -12,18 +12,17 @@ import os
 import shutil
 import subprocess
 import sys
+import threading
 import time
 from functools import reduce
 from itertools import combinations
 from os import environ
-from os.path import isdir, isfile, join
+from os.path import getmtime, isdir, isfile, join
+from pathlib import Path
 
-import autoreject as ar
 import mne
-import mne_connectivity
 import numpy as np
 from mne.preprocessing import ICA, find_bad_channels_maxwell
-from mne_connectivity import SpectralConnectivity
 
 from mne_pipeline_hd.pipeline.loading import MEEG, FSMRI
 from mne_pipeline_hd.pipeline.pipeline_utils import (
@@ -32,6 +31,8 @@ from mne_pipeline_hd.pipeline.pipeline_utils import (
     ismac,
     iswin,
     get_n_jobs,
+    get_cuda_n_jobs,
+    is_up_to_date,
     logger,
 )
 
@@ -80,6 +81,9 @@ def filter_data(
     erm_t_limit,
     bad_interpolation,
 ):
+    # use cuda for filtering if enabled and available
+    n_jobs = get_cuda_n_jobs(n_jobs, enable_cuda)
+
     # Compare Parameters from last run
     filtered_path = meeg.io_dict[filter_target]["path"]
     results = compare_filep(
@@ -90,11 +94,6 @@ def filter_data(
         # Load Data
         data = meeg.load(filter_target)
 
-        # use cuda for filtering if enabled
-        if enable_cuda:
-            mne.cuda.init_cuda(ignore_config=True)
-            n_jobs = "cuda"
-
         # Filter Data
         if filter_target == "evoked":
             for evoked in data:
@@ -196,10 +195,11 @@ def filter_data(
         print("no erm_file assigned")
 
 
-def notch_filter(meeg, notch_frequencies, n_jobs):
+def notch_filter(meeg, notch_frequencies, n_jobs, enable_cuda):
     raw_filtered = meeg.load_filtered()
 
-    raw_filtered = raw_filtered.notch_filter(notch_frequencies, n_jobs=1)
+    n_jobs = get_cuda_n_jobs(n_jobs, enable_cuda)
+    raw_filtered = raw_filtered.notch_filter(notch_frequencies, n_jobs=n_jobs)
     meeg.save_filtered(raw_filtered)
 
 
@@ -271,7 +271,8 @@ def eeg_reference_raw(meeg, ref_channels):
 def find_events(
     meeg, stim_channels, min_duration, shortest_event, adjust_timeline_by_msec
 ):
-    raw = meeg.load_raw()  # No copy to consume less memory
+    # Only the stim-channels are read from disk
+    raw = meeg.load_raw(preload=False)
 
     events = mne.find_events(
         raw,
@@ -281,10 +282,7 @@ def find_events(
     )
 
     # apply latency correction
-    events[:, 0] = [
-        ts + np.round(adjust_timeline_by_msec * 10**-3 * raw.info["sfreq"])
-        for ts in events[:, 0]
-    ]
+    events[:, 0] += int(np.round(adjust_timeline_by_msec * 10**-3 * raw.info["sfreq"]))
 
     ids = np.unique(events[:, 2])
     print("unique ID's found: ", ids)
@@ -295,12 +293,24 @@ def find_events(
         print("No events found")
 
 
+def _add_binary_events(events, blocked, samples, event_id):
+    """Add an event for each sample, which is not within one sample
+    of an already added event"""
+    for sample in samples:
+        if sample not in blocked:
+            events.append([sample, 0, event_id])
+            blocked.update((sample - 1, sample, sample + 1))
+
+
 def find_6ch_binary_events(meeg, min_duration, shortest_event, adjust_timeline_by_msec):
-    raw = meeg.load_raw()  # No copy to consume less memory
+    # Only the stim-channels are read from disk
+    raw = meeg.load_raw(preload=False)
 
     # Binary Coding of 6 Stim Channels in Biomagenetism Lab Heidelberg
     # prepare arrays
-    events = np.ndarray(shape=(0, 3), dtype=np.int32)
+    events = list()
+    # Samples within one sample of an already added event
+    blocked = set()
     evs = list()
     evs_tol = list()
 
@@ -367,11 +377,7 @@ def find_6ch_binary_events(meeg, min_duration, shortest_event, adjust_timeline_b
             evs[evs.index(i)] = i
 
         # add tolerance to each value
-        i_tol = np.ndarray(shape=(0, 1), dtype=np.int32)
-        for t in i:
-            i_tol = np.append(i_tol, t - 1)
-            i_tol = np.append(i_tol, t)
-            i_tol = np.append(i_tol, t + 1)
+        i_tol = np.column_stack((i - 1, i, i + 1)).ravel()
 
         evs_tol.append(i_tol)
 
@@ -386,13 +392,7 @@ def find_6ch_binary_events(meeg, min_duration, shortest_event, adjust_timeline_b
         equals = np.delete(equals, too_close, 0)
         equals -= 1  # correction, because of shift with deletion
 
-    for q in equals:
-        if (
-            q not in events[:, 0]
-            and q not in events[:, 0] + 1
-            and q not in events[:, 0] - 1
-        ):
-            events = np.append(events, [[q, 0, 63]], axis=0)
+    _add_binary_events(events, blocked, equals, 63)
 
     for a, b, c, d, e in combinations(range(6), 5):
         equals = reduce(
@@ -403,17 +403,9 @@ def find_6ch_binary_events(meeg, min_duration, shortest_event, adjust_timeline_b
             equals = np.delete(equals, too_close, 0)
             equals -= 1
 
-        for q in equals:
-            if (
-                q not in events[:, 0]
-                and q not in events[:, 0] + 1
-                and q not in events[:, 0] - 1
-            ):
-                events = np.append(
-                    events,
-                    [[q, 0, int(2**a + 2**b + 2**c + 2**d + 2**e)]],
-                    axis=0,
-                )
+        _add_binary_events(
+            events, blocked, equals, int(2**a + 2**b + 2**c + 2**d + 2**e)
+        )
 
     for a, b, c, d in combinations(range(6), 4):
         equals = reduce(
@@ -424,15 +416,7 @@ def find_6ch_binary_events(meeg, min_duration, shortest_event, adjust_timeline_b
             equals = np.delete(equals, too_close, 0)
             equals -= 1
 
-        for q in equals:
-            if (
-                q not in events[:, 0]
-                and q not in events[:, 0] + 1
-                and q not in events[:, 0] - 1
-            ):
-                events = np.append(
-                    events, [[q, 0, int(2**a + 2**b + 2**c + 2**d)]], axis=0
-                )
+        _add_binary_events(events, blocked, equals, int(2**a + 2**b + 2**c + 2**d))
 
     for a, b, c in combinations(range(6), 3):
         equals = reduce(np.intersect1d, (evs_tol[a], evs_tol[b], evs_tol[c]))
@@ -441,15 +425,7 @@ def find_6ch_binary_events(meeg, min_duration, shortest_event, adjust_timeline_b
             equals = np.delete(equals, too_close, 0)
             equals -= 1
 
-        for q in equals:
-            if (
-                q not in events[:, 0]
-                and q not in events[:, 0] + 1
-                and q not in events[:, 0] - 1
-            ):
-                events = np.append(
-                    events, [[q, 0, int(2**a + 2**b + 2**c)]], axis=0
-                )
+        _add_binary_events(events, blocked, equals, int(2**a + 2**b + 2**c))
 
     for a, b in combinations(range(6), 2):
         equals = np.intersect1d(evs_tol[a], evs_tol[b])
@@ -458,32 +434,18 @@ def find_6ch_binary_events(meeg, min_duration, shortest_event, adjust_timeline_b
             equals = np.delete(equals, too_close, 0)
             equals -= 1
 
-        for q in equals:
-            if (
-                q not in events[:, 0]
-                and q not in events[:, 0] + 1
-                and q not in events[:, 0] - 1
-            ):
-                events = np.append(events, [[q, 0, int(2**a + 2**b)]], axis=0)
+        _add_binary_events(events, blocked, equals, int(2**a + 2**b))
 
     # Get single-channel events
     for i in range(6):
-        for e in evs[i]:
-            if (
-                e not in events[:, 0]
-                and e not in events[:, 0] + 1
-                and e not in events[:, 0] - 1
-            ):
-                events = np.append(events, [[e, 0, 2**i]], axis=0)
+        _add_binary_events(events, blocked, evs[i], 2**i)
 
     # sort only along samples(column 0)
+    events = np.array(events, dtype=int).reshape(-1, 3)
     events = events[events[:, 0].argsort()]
 
     # apply latency correction
-    events[:, 0] = [
-        ts + np.round(adjust_timeline_by_msec * 10**-3 * raw.info["sfreq"])
-        for ts in events[:, 0]
-    ]
+    events[:, 0] += int(np.round(adjust_timeline_by_msec * 10**-3 * raw.info["sfreq"]))
 
     ids = np.unique(events[:, 2])
     print("unique ID's found: ", ids)
@@ -557,6 +519,10 @@ def epoch_raw(
 
     existing_ch_types = epochs.get_channel_types(unique=True, only_data_chs=True)
 
+    if use_autoreject is not None:
+        # Only import autoreject when used, it takes long to import
+        import autoreject as ar
+
     if use_autoreject == "Interpolation":
         ar_object = ar.AutoReject(
             n_interpolate=n_interpolates, consensus=consensus_percs, n_jobs=n_jobs
@@ -614,6 +580,8 @@ def run_ica(
     eog_channel,
     ica_ecg,
     ecg_channel,
+    ica_resample,
+    n_jobs,
     **kwargs,
 ):
     data = meeg.load(ica_fitto)
@@ -643,6 +611,9 @@ def run_ica(
         **ica_kwargs,
     )
 
+    if ica_autoreject:
+        import autoreject as ar
+
     if ica_autoreject and ica_fitto != "epochs":
         # Estimate Reject-Thresholds on simulated epochs
         # Creating simulated epochs with len 1s
@@ -664,6 +635,14 @@ def run_ica(
     if ica_remove_proj:
         filt_data.del_proj()
 
+    # Fit ICA on a downsampled copy (ICA scales linearly with n_samples),
+    # but never below the Nyquist-frequency of the lowpass
+    if ica_resample is not None:
+        ica_sfreq = max(ica_resample, 2 * filt_data.info["lowpass"])
+        if ica_sfreq < filt_data.info["sfreq"]:
+            print(f"Resampling to {ica_sfreq} Hz for fitting ICA")
+            filt_data = filt_data.copy().resample(ica_sfreq, n_jobs=n_jobs)
+
     fit_kwargs = check_kwargs(kwargs, ica.fit)
     ica.fit(
         filt_data,
@@ -772,15 +751,29 @@ def run_ica(
 def apply_ica(meeg, ica_apply_target, n_pca_components):
     # Check file-parameters to make sure,
     # that ica is not applied twice in a row
+    ica = meeg.load_ica()
+    ica_exclude = [int(idx) for idx in ica.exclude]
+    target_path = meeg.io_dict[ica_apply_target]["path"]
+    target_params = meeg.file_parameters.get(Path(target_path).name, dict())
+    if (
+        target_params.get("FUNCTION") == "apply_ica"
+        and target_params.get("ICA_EXCLUDE") == ica_exclude
+        and is_up_to_date(meeg, target_path, [meeg.ica_path], "apply_ica")
+    ):
+        logger().info(f"ICA is already applied to {ica_apply_target}")
+        return
 
     data = meeg.load(ica_apply_target)
-    ica = meeg.load_ica()
 
     if len(ica.exclude) == 0:
         print(f"No components excluded for {meeg.name}")
     else:
         applied_data = ica.apply(data, n_pca_components=n_pca_components)
         meeg.save(ica_apply_target, applied_data)
+        # Record apply_ica and the applied components in the file-parameters
+        meeg.save_file_params(target_path, function="apply_ica")
+        meeg.file_parameters[Path(target_path).name]["ICA_EXCLUDE"] = ica_exclude
+        meeg.save_file_parameter_file()
 
         # Apply to Empty-Room-Data as well if present
         if meeg.erm:
@@ -899,35 +892,27 @@ def tfr(
 
     # Calculate Time-Frequency for each trial from epochs
     # using the selected method
+    if tfr_method == "stockwell":
+        tfr_func = mne.time_frequency.tfr_stockwell
+        fmin, fmax = tfr_freqs[[0, -1]]
+        tfr_kwargs = {"fmin": fmin, "fmax": fmax, "width": stockwell_width}
+    elif tfr_method == "multitaper":
+        tfr_func = mne.time_frequency.tfr_multitaper
+        tfr_kwargs = {"time_bandwidth": multitaper_bandwidth}
+    else:
+        tfr_func = mne.time_frequency.tfr_morlet
+        tfr_kwargs = dict()
+    # Filter the additional keyword-arguments only once for all trials
+    tfr_kwargs.update(check_kwargs(kwargs, tfr_func))
+
     for trial, epoch in meeg.get_trial_epochs():
-        if tfr_method == "multitaper":
-            multitaper_kwargs = check_kwargs(kwargs, mne.time_frequency.tfr_multitaper)
-            tfr_result = mne.time_frequency.tfr_multitaper(
-                epoch,
-                freqs=tfr_freqs,
-                n_cycles=tfr_n_cycles,
-                time_bandwidth=multitaper_bandwidth,
-                n_jobs=n_jobs,
-                use_fft=tfr_use_fft,
-                return_itc=tfr_average,
-                average=tfr_average,
-                **multitaper_kwargs,
-            )
-        elif tfr_method == "stockwell":
-            fmin, fmax = tfr_freqs[[0, -1]]
-            stockwell_kwargs = check_kwargs(kwargs, mne.time_frequency.tfr_stockwell)
-            tfr_result = mne.time_frequency.tfr_stockwell(
-                epoch,
-                fmin=fmin,
-                fmax=fmax,
-                width=stockwell_width,
-                n_jobs=n_jobs,
-                return_itc=True,
-                **stockwell_kwargs,
-            )
+        if tfr_method == "stockwell":
+            tfr_result = tfr_func(epoch, n_jobs=n_jobs, return_itc=True, **tfr_kwargs)
         else:
-            morlet_kwargs = check_kwargs(kwargs, mne.time_frequency.tfr_morlet)
-            tfr_result = mne.time_frequency.tfr_morlet(
+            # Morlet and Multitaper share the same wavelet-convolution
+            # (MNE already uses scipy.fft for it and parallelizes
+            # over channels with n_jobs)
+            tfr_result = tfr_func(
                 epoch,
                 freqs=tfr_freqs,
                 n_cycles=tfr_n_cycles,
@@ -935,7 +920,7 @@ def tfr(
                 use_fft=tfr_use_fft,
                 return_itc=tfr_average,
                 average=tfr_average,
-                **morlet_kwargs,
+                **tfr_kwargs,
             )
 
         if isinstance(tfr_result, tuple):
@@ -975,39 +960,42 @@ def tfr(
 
 
 def grand_avg_tfr(group):
-    trial_dict = dict()
+    # Only keep the running sum of the power for each trial
+    # instead of the powers of all subjects
+    sum_dict = dict()
+    n_dict = dict()
     for name in group.group_list:
         meeg = MEEG(name, group.ct)
         print(f"Add {name} to grand_average")
         powers = meeg.load_power_tfr_average()
         for pw in powers:
-            if pw.nave != 0:
-                if pw.comment in trial_dict:
-                    trial_dict[pw.comment].append(pw)
-                else:
-                    trial_dict.update({pw.comment: [pw]})
-            else:
+            if pw.nave == 0:
                 print(f"{pw.comment} for {name} got nave=0")
+                continue
+            trial = pw.comment
+            # Bad channels are dropped from the grand-average
+            if len(pw.info["bads"]) > 0:
+                pw.drop_channels(pw.info["bads"])
+            if trial in sum_dict:
+                ga = sum_dict[trial]
+                # Make sure, all have the same number of channels
+                commons = [ch for ch in ga.ch_names if ch in pw.ch_names]
+                if len(commons) < len(ga.ch_names):
+                    print(f"{trial}:Reducing all n_channels to {len(commons)}")
+                    ga.pick(commons)
+                ga.data += pw.data[[pw.ch_names.index(ch) for ch in commons]]
+                n_dict[trial] += 1
+            else:
+                sum_dict[trial] = pw
+                n_dict[trial] = 1
+        del powers
 
     ga_dict = dict()
-    for trial in trial_dict:
-        if len(trial_dict[trial]) != 0:
-            # Make sure, all have the same number of channels
-            commons = set()
-            for pw in trial_dict[trial]:
-                if len(commons) == 0:
-                    for c in pw.ch_names:
-                        commons.add(c)
-                commons = commons & set(pw.ch_names)
-            print(f"{trial}:Reducing all n_channels to {len(commons)}")
-            for idx, pw in enumerate(trial_dict[trial]):
-                trial_dict[trial][idx] = pw.pick(list(commons))
-
-            ga = mne.grand_average(
-                trial_dict[trial], interpolate_bads=True, drop_bads=True
-            )
-            ga.comment = trial
-            ga_dict[trial] = ga
+    for trial, ga in sum_dict.items():
+        ga.data /= n_dict[trial]
+        ga.nave = n_dict[trial]
+        ga.comment = trial
+        ga_dict[trial] = ga
 
     group.save_ga_tfr(ga_dict)
 
@@ -1188,17 +1176,49 @@ def prepare_bem(fsmri, bem_spacing, bem_conductivity):
     fsmri.save_bem_solution(bem_solution)
 
 
+# Keep only the last Source-Morph computed in this session
+# (the MEEG-files of one FSMRI can reuse it, without keeping all morphs in memory)
+_last_source_morph = dict()
+# morph_fsmri may run in several threads
+_last_source_morph_lock = threading.Lock()
+
+
 def morph_fsmri(meeg, morph_to):
     if meeg.fsmri.name != morph_to:
-        forward = meeg.load_forward()
         fsmri_to = FSMRI(morph_to, meeg.ct)
-        morph = mne.compute_source_morph(
-            forward["src"],
-            subject_from=meeg.fsmri.name,
-            subject_to=morph_to,
-            subjects_dir=meeg.subjects_dir,
-            src_to=fsmri_to.load_source_space(),
+        if is_up_to_date(
+            meeg,
+            meeg.source_morph_path,
+            [meeg.forward_path, fsmri_to.io_dict["src"]["path"]],
+            "morph_fsmri",
+        ):
+            logger().info(f"Source-Morph for {meeg.name} is already up to date")
+            return
+        forward = meeg.load_forward()
+        # MEEG-files with the same FSMRI (and thus the same vertices)
+        # can share the same morph (as long as the target is unchanged)
+        src_to_path = fsmri_to.io_dict["src"]["path"]
+        morph_key = (
+            meeg.fsmri.name,
+            morph_to,
+            tuple(s["vertno"].tobytes() for s in forward["src"]),
+            getmtime(src_to_path) if isfile(src_to_path) else None,
         )
+        with _last_source_morph_lock:
+            morph = _last_source_morph.get(morph_key)
+        if morph is not None:
+            logger().info(f"Using the Source-Morph computed for {meeg.fsmri.name}")
+        else:
+            morph = mne.compute_source_morph(
+                forward["src"],
+                subject_from=meeg.fsmri.name,
+                subject_to=morph_to,
+                subjects_dir=meeg.subjects_dir,
+                src_to=fsmri_to.load_source_space(),
+            )
+            with _last_source_morph_lock:
+                _last_source_morph.clear()
+                _last_source_morph[morph_key] = morph
         meeg.save_source_morph(morph)
     else:
         logger().info(
@@ -1248,6 +1268,20 @@ def morph_labels_from_fsaverage(fsmri):
 
 
 def create_forward_solution(meeg, n_jobs, ch_types):
+    if is_up_to_date(
+        meeg,
+        meeg.forward_path,
+        [
+            meeg.raw_path,
+            meeg.trans_path,
+            meeg.fsmri.io_dict["bem_solution"]["path"],
+            meeg.fsmri.io_dict["src"]["path"],
+        ],
+        "create_forward_solution",
+    ):
+        logger().info(f"Forward-Solution for {meeg.name} is already up to date")
+        return
+
     info = meeg.load_info()
     trans = meeg.load_transformation()
     bem = meeg.fsmri.load_bem_solution()
@@ -1267,6 +1301,19 @@ def estimate_noise_covariance(
     meeg, baseline, n_jobs, noise_cov_mode, noise_cov_method, **kwargs
 ):
     # ToDo: method='factor_analysis' can only be used with rank='full'
+    if noise_cov_mode == "epochs" or meeg.erm is None:
+        cov_source_path = meeg.epochs_path
+    else:
+        cov_source_path = meeg.erm_processed_path
+    if is_up_to_date(
+        meeg,
+        meeg.noise_covariance_path,
+        [cov_source_path],
+        "estimate_noise_covariance",
+    ):
+        logger().info(f"Noise-Covariance for {meeg.name} is already up to date")
+        return
+
     if noise_cov_mode == "epochs" or meeg.erm is None:
         print("Noise Covariance on epochs-Baseline")
         epochs = meeg.load_epochs()
@@ -1297,6 +1344,15 @@ def estimate_noise_covariance(
 
 
 def create_inverse_operator(meeg):
+    if is_up_to_date(
+        meeg,
+        meeg.inverse_path,
+        [meeg.raw_path, meeg.noise_covariance_path, meeg.forward_path],
+        "create_inverse_operator",
+    ):
+        logger().info(f"Inverse-Operator for {meeg.name} is already up to date")
+        return
+
     info = meeg.load_info()
     noise_covariance = meeg.load_noise_covariance()
     forward = meeg.load_forward()
@@ -1312,10 +1368,25 @@ def source_estimate(meeg, inverse_method, pick_ori, lambda2):
     evokeds = meeg.load_evokeds()
 
     stcs = dict()
+    # Prepare the inverse operator only once for trials with the same
+    # number of averaged epochs (instead of once for each trial)
+    prepared_inverses = dict()
     for evoked in [ev for ev in evokeds if ev.comment in meeg.sel_trials]:
+        if evoked.nave not in prepared_inverses:
+            prepared_inverses[evoked.nave] = mne.minimum_norm.prepare_inverse_operator(
+                inverse_operator, evoked.nave, lambda2, method=inverse_method
+            )
         stc = mne.minimum_norm.apply_inverse(
-            evoked, inverse_operator, lambda2, method=inverse_method, pick_ori=pick_ori
+            evoked,
+            prepared_inverses[evoked.nave],
+            lambda2,
+            method=inverse_method,
+            pick_ori=pick_ori,
+            prepared=True,
         )
+        # Single precision is sufficient for source estimates
+        # (and is what .stc-files store anyway)
+        stc.data = stc.data.astype(np.float32, copy=False)
         stcs.update({evoked.comment: stc})
 
     meeg.save_source_estimates(stcs)
@@ -1333,14 +1404,16 @@ def label_time_course(meeg, target_labels, extract_mode):
 
     ltc_dict = dict()
 
-    for trial in stcs:
+    # Extract all labels for all trials in one pass
+    trials = list(stcs)
+    ltcs = mne.extract_label_time_course(
+        [stcs[trial] for trial in trials], labels, src, mode=extract_mode
+    )
+    for trial, ltc in zip(trials, ltcs):
         ltc_dict[trial] = dict()
         times = stcs[trial].times
-        for label in labels:
-            ltc = stcs[trial].extract_label_time_course(label, src, mode=extract_mode)[
-                0
-            ]
-            ltc_dict[trial][label.name] = np.vstack((ltc, times))
+        for label_idx, label in enumerate(labels):
+            ltc_dict[trial][label.name] = np.vstack((ltc[label_idx], times))
 
     meeg.save_ltc(ltc_dict)
 
@@ -1484,8 +1557,37 @@ def apply_morph(meeg, morph_to):
         morph = meeg.load_source_morph()
 
         morphed_stcs = dict()
-        for trial in stcs:
-            morphed_stcs[trial] = morph.apply(stcs[trial])
+        trials = list(stcs)
+        if (
+            morph.kind == "surface"
+            and morph.morph_mat is not None
+            and all(type(stcs[t]) is mne.SourceEstimate for t in trials)
+            and all(
+                np.array_equal(v_from, v)
+                for t in trials
+                for v_from, v in zip(morph.src_data["vertices_from"], stcs[t].vertices)
+            )
+        ):
+            # Morph all trials with one sparse matrix-multiplication
+            # by concatenating them along the time-axis
+            # (in single precision to halve the memory-traffic, the casts are
+            # local to not change the loaded morph and source estimates)
+            morph_mat = morph.morph_mat.astype(np.float32)
+            all_data = morph_mat @ np.concatenate(
+                [stcs[t].data for t in trials], axis=1, dtype=np.float32
+            )
+            split_idxs = np.cumsum([stcs[t].shape[1] for t in trials])[:-1]
+            for trial, data in zip(trials, np.split(all_data, split_idxs, axis=1)):
+                morphed_stcs[trial] = mne.SourceEstimate(
+                    data,
+                    vertices=morph.vertices_to,
+                    tmin=stcs[trial].tmin,
+                    tstep=stcs[trial].tstep,
+                    subject=morph.subject_to,
+                )
+        else:
+            for trial in trials:
+                morphed_stcs[trial] = morph.apply(stcs[trial])
         meeg.save_morphed_source_estimates(morphed_stcs)
     else:
         logger().info(
@@ -1551,6 +1653,8 @@ def src_connectivity(
         )
 
         sfreq = info["sfreq"]  # the sampling frequency
+        import mne_connectivity
+
         con = mne_connectivity.spectral_connectivity_epochs(
             label_ts,
             names=target_labels,
@@ -1576,60 +1680,62 @@ def src_connectivity(
 
 
 def grand_avg_morphed(group, morph_to):
-    # for less memory only import data from stcs and add it to one
-    # stc in the end!!!
-    n_chunks = 8
-    # divide in chunks to save memory
-    fusion_dict = dict()
-    for i in range(0, len(group.group_list), n_chunks):
-        sub_trial_dict = dict()
-        ga_chunk = group.group_list[i : i + n_chunks]
-        print(ga_chunk)
-        for name in ga_chunk:
-            meeg = MEEG(name, group.ct)
-            print(f"Add {name} to grand_average")
-            if morph_to == meeg.fsmri.name:
-                stcs = meeg.load_source_estimates()
-            else:
-                stcs = meeg.load_morphed_source_estimates()
+    # For less memory only keep the running sum of the data for each trial
+    # and release the source-estimates of each subject after adding them
+    sum_dict = dict()
+    n_dict = dict()
+    # Vertices of the source-space of morph_to (loaded when needed)
+    vertices_to = None
+    for name in group.group_list:
+        meeg = MEEG(name, group.ct)
+        print(f"Add {name} to grand_average")
+        if morph_to == meeg.fsmri.name:
+            stcs = meeg.load_source_estimates()
+            # Vertices may have been lost in the forward-solution,
+            # which is fixed with a smoothing morph onto all vertices
+            if vertices_to is None:
+                src_to = FSMRI(morph_to, group.ct).load_source_space()
+                vertices_to = [s["vertno"] for s in src_to]
+            # (all trials share the same vertices and thus the same morph)
+            self_morph = None
+            for trial, stc in stcs.items():
+                if not all(
+                    np.array_equal(v, vt) for v, vt in zip(stc.vertices, vertices_to)
+                ):
+                    print(f"Morphing {name}-{trial} onto all vertices of {morph_to}")
+                    if self_morph is None:
+                        self_morph = mne.compute_source_morph(
+                            stc,
+                            subject_from=morph_to,
+                            subject_to=morph_to,
+                            subjects_dir=group.subjects_dir,
+                            spacing=vertices_to,
+                            smooth=1,
+                        )
+                    stcs[trial] = self_morph.apply(stc)
+        else:
+            stcs = meeg.load_morphed_source_estimates()
 
-            for trial in stcs:
-                if trial in sub_trial_dict:
-                    sub_trial_dict[trial].append(stcs[trial])
-                else:
-                    sub_trial_dict.update({trial: [stcs[trial]]})
-
-        # Average chunks
-        for trial in sub_trial_dict:
-            if len(sub_trial_dict[trial]) != 0:
-                print(f"grand_average for {trial}-chunk {i}-{i + n_chunks}")
-                sub_trial_average = sub_trial_dict[trial][0].copy()
-                n_subjects = len(sub_trial_dict[trial])
-
-                for trial_index in range(1, n_subjects):
-                    sub_trial_average.data += sub_trial_dict[trial][trial_index].data
-
-                sub_trial_average.data /= n_subjects
-                sub_trial_average.comment = trial
-                if trial in fusion_dict:
-                    fusion_dict[trial].append(sub_trial_average)
-                else:
-                    fusion_dict.update({trial: [sub_trial_average]})
+        for trial in stcs:
+            if trial in sum_dict:
+                sum_dict[trial].data += stcs[trial].data
+                n_dict[trial] += 1
+            else:
+                sum_dict[trial] = stcs[trial].copy()
+                sum_dict[trial].data = sum_dict[trial].data.astype(
+                    np.float32, copy=False
+                )
+                n_dict[trial] = 1
+        del stcs
 
     ga_stcs = dict()
-    for trial in fusion_dict:
-        if len(fusion_dict[trial]) != 0:
-            print(f"grand_average for {group.name}-{trial}")
-            trial_average = fusion_dict[trial][0].copy()
-            n_subjects = len(fusion_dict[trial])
-
-            for trial_index in range(1, n_subjects):
-                trial_average.data += fusion_dict[trial][trial_index].data
+    for trial in sum_dict:
+        print(f"grand_average for {group.name}-{trial}")
+        trial_average = sum_dict[trial]
+        trial_average.data /= n_dict[trial]
+        trial_average.comment = trial
 
-            trial_average.data /= n_subjects
-            trial_average.comment = trial
-
-            ga_stcs[trial] = trial_average
+        ga_stcs[trial] = trial_average
 
     group.save_ga_stc(ga_stcs)
 
@@ -1669,38 +1775,50 @@ def grand_avg_ltc(group):
 
 
 def grand_avg_connect(group):
-    # Prepare the Average-Dict
-    con_average_dict = dict()
+    from mne_connectivity import SpectralConnectivity
+
+    # Only keep the running sum of the connectivity-data for each trial
+    # and method (and the first connectivity-object for its attributes)
+    con_first_dict = dict()
+    con_sum_dict = dict()
+    con_n_dict = dict()
     for name in group.group_list:
         meeg = MEEG(name, group.ct)
         print(f"Add {name} to grand_average")
         con_dict = meeg.load_connectivity()
         for trial in con_dict:
-            if trial not in con_average_dict:
-                con_average_dict[trial] = dict()
+            if trial not in con_sum_dict:
+                con_first_dict[trial] = dict()
+                con_sum_dict[trial] = dict()
+                con_n_dict[trial] = dict()
             for con_method, con in con_dict[trial].items():
-                if con_method not in con_average_dict[trial]:
-                    con_average_dict[trial][con_method] = list()
-                con_average_dict[trial][con_method].append(con)
+                if con_method in con_sum_dict[trial]:
+                    con_sum_dict[trial][con_method] += con.get_data()
+                    con_n_dict[trial][con_method] += 1
+                else:
+                    con_first_dict[trial][con_method] = con
+                    con_sum_dict[trial][con_method] = con.get_data().copy()
+                    con_n_dict[trial][con_method] = 1
+        del con_dict
 
     ga_con_dict = dict()
-    for trial in con_average_dict:
+    for trial in con_sum_dict:
         ga_con_dict[trial] = dict()
-        for con_method, con_list in con_average_dict[trial].items():
-            if len(con_list) != 0:
-                print(f"grand_average for {trial}-{con_method}")
-                avg_data = np.mean([con.get_data() for con in con_list], axis=0)
-
-                ga_con = SpectralConnectivity(
-                    data=avg_data,
-                    freqs=con_list[0].freqs,
-                    n_nodes=con_list[0].n_nodes,
-                    names=con_list[0].names,
-                    indices=con_list[0].indices,
-                    method=con_list[0].method,
-                    n_epochs_used=len(con_list),
-                )
-                ga_con_dict[trial][con_method] = ga_con
+        for con_method, con_sum in con_sum_dict[trial].items():
+            print(f"grand_average for {trial}-{con_method}")
+            first_con = con_first_dict[trial][con_method]
+            n_cons = con_n_dict[trial][con_method]
+
+            ga_con = SpectralConnectivity(
+                data=con_sum / n_cons,
+                freqs=first_con.freqs,
+                n_nodes=first_con.n_nodes,
+                names=first_con.names,
+                indices=first_con.indices,
+                method=first_con.method,
+                n_epochs_used=n_cons,
+            )
+            ga_con_dict[trial][con_method] = ga_con
 
     group.save_ga_con(ga_con_dict)
 
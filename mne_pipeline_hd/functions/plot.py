@@ -13,7 +13,6 @@ from os.path import join
 
 import matplotlib.pyplot as plt
 import mne
-import mne_connectivity
 import numpy as np
 
 # Make use of program also possible with sensor-space installation of mne
@@ -863,6 +862,9 @@ def _get_n_subplots(n_items):
 
 
 def _plot_connectivity(obj, con_dict, label_colors, show_plots):
+    # Import here to avoid the slow import of mne_connectivity at startup
+    import mne_connectivity
+
     for trial in con_dict:
         for con_method, con in con_dict[trial].items():
             labels = obj.fsmri.get_labels(con.names)
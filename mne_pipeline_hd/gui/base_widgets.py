@@ -11,7 +11,7 @@ import sys
 
 import numpy as np
 import pandas
-from qtpy.QtCore import QItemSelectionModel, QTimer, Qt, Signal
+from qtpy.QtCore import QItemSelection, QItemSelectionModel, QTimer, Qt, Signal
 from qtpy.QtGui import QFont
 from qtpy.QtWidgets import (
     QAbstractItemView,
@@ -164,14 +164,17 @@ class BaseList(Base):
             self.view.setSelectionMode(QAbstractItemView.ExtendedSelection)
 
     def select(self, values, clear_selection=True):
-        indices = [i for i, x in enumerate(self.model._data) if x in values]
+        # Collect all matches first to apply them with a single selectionChanged
+        selection = QItemSelection()
+        for idx, x in enumerate(self.model._data):
+            if x in values:
+                index = self.model.createIndex(idx, 0)
+                selection.select(index, index)
 
         if clear_selection:
             self.view.selectionModel().clearSelection()
 
-        for idx in indices:
-            index = self.model.createIndex(idx, 0)
-            self.view.selectionModel().select(index, QItemSelectionModel.Select)
+        self.view.selectionModel().select(selection, QItemSelectionModel.Select)
 
 
 class SimpleList(BaseList):
@@ -665,21 +668,19 @@ class BaseDict(Base):
         logger().debug(f"Selection to {selected_data}")
 
     def select(self, keys, values, clear_selection=True):
-        key_indices = [i for i, x in enumerate(self.model._data.keys()) if x in keys]
-        value_indices = [
-            i for i, x in enumerate(self.model._data.values()) if x in values
-        ]
+        selection = QItemSelection()
+        for idx, (key, value) in enumerate(self.model._data.items()):
+            if key in keys:
+                index = self.model.createIndex(idx, 0)
+                selection.select(index, index)
+            if value in values:
+                index = self.model.createIndex(idx, 1)
+                selection.select(index, index)
 
         if clear_selection:
             self.view.selectionModel().clearSelection()
 
-        for idx in key_indices:
-            index = self.model.createIndex(idx, 0)
-            self.view.selectionModel().select(index, QItemSelectionModel.Select)
-
-        for idx in value_indices:
-            index = self.model.createIndex(idx, 1)
-            self.view.selectionModel().select(index, QItemSelectionModel.Select)
+        self.view.selectionModel().select(selection, QItemSelectionModel.Select)
 
 
 class SimpleDict(BaseDict):
@@ -6,6 +6,7 @@ Github: https://github.com/marsipu/mne-pipeline-hd
 """
 
 from collections import Counter
+from functools import lru_cache
 from importlib import resources
 from pathlib import Path
 
@@ -344,39 +345,46 @@ class CopyParamsDialog(SimpleDialog):
         )
 
 
+_about_template = (
+    "<h1>MNE-Pipeline HD</h1>"
+    "<b>A Pipeline-GUI for MNE-Python</b><br>"
+    "(originally developed for MEG-Lab Heidelberg)<br>"
+    "<i>Development was initially inspired by: "
+    "<a href=https://doi.org/10.3389/fnins.2018.00006>Andersen "
+    "L.M. 2018</a></i><br>"
+    "<br>"
+    "As for now, this program is still in alpha-state, "
+    "so some features may not work as expected. "
+    "Be sure to check all the parameters for each step "
+    "to be correctly adjusted to your needs.<br>"
+    "<br>"
+    "<b>Developed by:</b><br>"
+    "Martin Schulz (medical student, Heidelberg)<br>"
+    "<br>"
+    "<b>Dependencies:</b><br>"
+    "MNE-Python: <a href=https://github.com/mne-tools/"
+    "mne-python>Website</a>"
+    "<a href=https://github.com/mne-tools/mne-python>"
+    "GitHub</a><br>"
+    "<a href=https://github.com/5yutan5/PyQtDarkTheme>"
+    "pyqtdarktheme</a><br>"
+    "<br>"
+    "<b>Licensed under:</b><br>{license_text}"
+)
+
+
+@lru_cache(maxsize=None)
+def _get_about_html():
+    # Read and format the license only once
+    license_text = (resources.files(extra) / "license.txt").read_text()
+    return _about_template.format(license_text=license_text.replace("\n", "<br>"))
+
+
 class AboutDialog(QDialog):
     def __init__(self, main_win):
         super().__init__(main_win)
         self.mw = main_win
-        with open(resources.files(extra) / "license.txt", "r") as file:
-            license_text = file.read()
-        license_text = license_text.replace("\n", "<br>")
-        text = (
-            "<h1>MNE-Pipeline HD</h1>"
-            "<b>A Pipeline-GUI for MNE-Python</b><br>"
-            "(originally developed for MEG-Lab Heidelberg)<br>"
-            "<i>Development was initially inspired by: "
-            "<a href=https://doi.org/10.3389/fnins.2018.00006>Andersen "
-            "L.M. 2018</a></i><br>"
-            "<br>"
-            "As for now, this program is still in alpha-state, "
-            "so some features may not work as expected. "
-            "Be sure to check all the parameters for each step "
-            "to be correctly adjusted to your needs.<br>"
-            "<br>"
-            "<b>Developed by:</b><br>"
-            "Martin Schulz (medical student, Heidelberg)<br>"
-            "<br>"
-            "<b>Dependencies:</b><br>"
-            "MNE-Python: <a href=https://github.com/mne-tools/"
-            "mne-python>Website</a>"
-            "<a href=https://github.com/mne-tools/mne-python>"
-            "GitHub</a><br>"
-            "<a href=https://github.com/5yutan5/PyQtDarkTheme>"
-            "pyqtdarktheme</a><br>"
-            "<br>"
-            "<b>Licensed under:</b><br>" + license_text
-        )
+        text = _get_about_html()
 
         layout = QVBoxLayout()
 
@@ -62,7 +62,7 @@ from mne_pipeline_hd.gui.gui_utils import (
 )
 from mne_pipeline_hd.gui.models import CustomFunctionModel, RunModel
 from mne_pipeline_hd.pipeline.function_utils import QRunController
-from mne_pipeline_hd.pipeline.pipeline_utils import QS
+from mne_pipeline_hd.pipeline.pipeline_utils import QS, read_pd_csv
 
 
 class RunDialog(QDialog):
@@ -1204,20 +1204,8 @@ class ImportFuncs(QDialog):
                 pd_params_path = join(
                     self.cf.file_path.parent, f"{self.cf.pkg_name}_parameters.csv"
                 )
-                self.cf.add_pd_funcs = pd.read_csv(
-                    pd_funcs_path,
-                    sep=";",
-                    index_col=0,
-                    na_values=[""],
-                    keep_default_na=False,
-                )
-                self.cf.add_pd_params = pd.read_csv(
-                    pd_params_path,
-                    sep=";",
-                    index_col=0,
-                    na_values=[""],
-                    keep_default_na=False,
-                )
+                self.cf.add_pd_funcs = read_pd_csv(pd_funcs_path)
+                self.cf.add_pd_params = read_pd_csv(pd_params_path)
 
                 # Can be removed soon, when nobody uses
                 # old packages anymore (10.11.2020)
@@ -1298,9 +1286,7 @@ class ImportFuncs(QDialog):
         if self.edit_existing:
             # Drop Functions which are not selected
             self.cf.add_pd_funcs.drop(
-                index=[
-                    f for f in self.cf.add_pd_funcs.index if f not in selected_funcs
-                ],
+                index=self.cf.add_pd_funcs.index.difference(selected_funcs),
                 inplace=True,
             )
 
@@ -1391,14 +1377,19 @@ class SelectDependencies(QDialog):
         self.open()
 
     def populate_listw(self):
-        for function in self.cf_dialog.ct.pd_funcs.index:
-            item = QListWidgetItem(function)
-            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
-            if function in self.dpd_list:
-                item.setCheckState(Qt.Checked)
-            else:
-                item.setCheckState(Qt.Unchecked)
-            self.listw.addItem(item)
+        dpd_set = set(self.dpd_list)
+        self.listw.setUpdatesEnabled(False)
+        try:
+            for function in self.cf_dialog.ct.pd_funcs.index:
+                item = QListWidgetItem(function)
+                item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+                if function in dpd_set:
+                    item.setCheckState(Qt.Checked)
+                else:
+                    item.setCheckState(Qt.Unchecked)
+                self.listw.addItem(item)
+        finally:
+            self.listw.setUpdatesEnabled(True)
 
     def item_checked(self, item):
         if item.checkState == Qt.Checked:
@@ -1543,33 +1534,19 @@ class SavePkgDialog(QDialog):
                     self.pkg_path, f"{self.cf_dialog.pkg_name}_parameters.csv"
                 )
                 if isfile(pd_funcs_path):
-                    read_pd_funcs = pd.read_csv(
-                        pd_funcs_path,
-                        sep=";",
-                        index_col=0,
-                        na_values=[""],
-                        keep_default_na=False,
-                    )
+                    read_pd_funcs = read_pd_csv(pd_funcs_path)
                     # Replace indexes from file with same name
-                    drop_funcs = [
-                        f for f in read_pd_funcs.index if f in final_add_pd_funcs.index
-                    ]
+                    drop_funcs = read_pd_funcs.index.intersection(
+                        final_add_pd_funcs.index
+                    )
                     read_pd_funcs.drop(index=drop_funcs, inplace=True)
                     final_add_pd_funcs = pd.concat([read_pd_funcs, final_add_pd_funcs])
                 if isfile(pd_params_path):
-                    read_pd_params = pd.read_csv(
-                        pd_params_path,
-                        sep=";",
-                        index_col=0,
-                        na_values=[""],
-                        keep_default_na=False,
-                    )
+                    read_pd_params = read_pd_csv(pd_params_path)
                     # Replace indexes from file with same name
-                    drop_params = [
-                        p
-                        for p in read_pd_params.index
-                        if p in final_add_pd_params.index
-                    ]
+                    drop_params = read_pd_params.index.intersection(
+                        final_add_pd_params.index
+                    )
                     read_pd_params.drop(index=drop_params, inplace=True)
                     final_add_pd_params = pd.concat(
                         [read_pd_params, final_add_pd_params]
@@ -1622,19 +1599,19 @@ class SavePkgDialog(QDialog):
             final_add_pd_funcs.to_csv(pd_funcs_path, sep=";")
             final_add_pd_params.to_csv(pd_params_path, sep=";")
 
-            for func in [
-                f
-                for f in final_add_pd_funcs.index
-                if f in self.cf_dialog.add_pd_funcs.index
-            ]:
-                self.cf_dialog.add_pd_funcs.drop(index=func, inplace=True)
+            self.cf_dialog.add_pd_funcs.drop(
+                index=final_add_pd_funcs.index.intersection(
+                    self.cf_dialog.add_pd_funcs.index
+                ),
+                inplace=True,
+            )
             self.cf_dialog.update_func_cmbx()
-            for param in [
-                p
-                for p in final_add_pd_params.index
-                if p in self.cf_dialog.add_pd_params
-            ]:
-                self.cf_dialog.add_pd_params.drop(index=param, inplace=True)
+            self.cf_dialog.add_pd_params.drop(
+                index=final_add_pd_params.index.intersection(
+                    self.cf_dialog.add_pd_params.index
+                ),
+                inplace=True,
+            )
             self.cf_dialog.clear_func_items()
             self.cf_dialog.clear_param_items()
 
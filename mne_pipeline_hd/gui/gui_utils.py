@@ -5,6 +5,7 @@ License: BSD 3-Clause
 Github: https://github.com/marsipu/mne-pipeline-hd
 """
 
+import codecs
 import io
 import logging
 import multiprocessing
@@ -44,8 +45,12 @@ from mne_pipeline_hd.pipeline.pipeline_utils import QS, logger
 
 
 def center(widget):
+    # Nothing to move for maximized or fullscreen windows
+    if widget.isMaximized() or widget.isFullScreen():
+        return
     qr = widget.frameGeometry()
-    cp = QApplication.primaryScreen().availableGeometry().center()
+    # Center on the screen the widget is on
+    cp = widget.screen().availableGeometry().center()
     qr.moveCenter(cp)
     widget.move(qr.topLeft())
 
@@ -551,7 +556,8 @@ class QProcessWorker(QObject):
         Parameters
         ----------
         commands : str, list
-            Provide a command or a list of commands.
+            Provide a command or a list of commands. A command can also
+            be given as a list of the program and its arguments.
         printtostd : bool
             Set False if stdout/stderr are not supposed
              to be passed to sys.stdout/sys.stderr.
@@ -561,18 +567,24 @@ class QProcessWorker(QObject):
         # Parse command(s)
         if not isinstance(commands, list):
             commands = [commands]
-        self.commands = [cmd.split(" ") for cmd in commands]
+        self.commands = [
+            cmd.split(" ") if isinstance(cmd, str) else list(cmd) for cmd in commands
+        ]
         self.printtostd = printtostd
         self.process = None
+        # Incremental decoders keep multibyte characters intact,
+        # which may be split between two reads of the streamed output
+        self.stdout_decoder = None
+        self.stderr_decoder = None
 
     def handle_stdout(self):
-        text = bytes(self.process.readAllStandardOutput()).decode("utf8")
+        text = self.stdout_decoder.decode(bytes(self.process.readAllStandardOutput()))
         self.stdoutSignal.emit(text)
         if self.printtostd:
             sys.stdout.write(text)
 
     def handle_stderr(self):
-        text = bytes(self.process.readAllStandardError()).decode("utf8")
+        text = self.stderr_decoder.decode(bytes(self.process.readAllStandardError()))
         self.stderrSignal.emit(text)
         if self.printtostd:
             sys.stderr.write(text)
@@ -605,6 +617,8 @@ class QProcessWorker(QObject):
     def start(self):
         # Take the first command from commands until empty.
         cmd = self.commands.pop(0)
+        self.stdout_decoder = codecs.getincrementaldecoder("utf8")(errors="replace")
+        self.stderr_decoder = codecs.getincrementaldecoder("utf8")(errors="replace")
         self.process = QProcess()
         self.process.errorOccurred.connect(self.error_occurred)
         self.process.readyReadStandardOutput.connect(self.handle_stdout)
@@ -7,7 +7,6 @@ Github: https://github.com/marsipu/mne-pipeline-hd
 import os
 import re
 import shutil
-import time
 from collections import Counter
 from functools import partial
 from os.path import exists, isfile, join
@@ -148,8 +147,8 @@ def index_parser(index, all_items, groups=None):
                     indices.append(int(sp))
 
         elif groups is not None and index in groups:
-            files = [x for x in all_items if x in groups[index]]
-            indices = [all_items.index(x) for x in files]
+            group_items = set(groups[index])
+            indices = [i for i, x in enumerate(all_items) if x in group_items]
 
         else:
             if len(all_items) < int(index) or int(index) < 0:
@@ -157,6 +156,7 @@ def index_parser(index, all_items, groups=None):
             else:
                 indices = [int(index)]
 
+        rm = set(rm)
         indices = [i for i in indices if i not in rm]
         files = np.asarray(all_items)[indices].tolist()
 
@@ -515,12 +515,20 @@ class GrandAvgFileAdd(QDialog):
         self.load_list()
 
     def load_list(self):
-        for item_name in self.mw.ct.pr.all_meeg:
-            if item_name not in self.mw.ct.pr.all_groups[self.group.text(0)]:
-                item = QListWidgetItem(item_name)
-                item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
-                item.setCheckState(Qt.Unchecked)
-                self.listw.addItem(item)
+        group_files = set(self.mw.ct.pr.all_groups[self.group.text(0)])
+        # Insert all items in one pass without repainting after each one
+        self.listw.setUpdatesEnabled(False)
+        self.listw.blockSignals(True)
+        try:
+            for item_name in self.mw.ct.pr.all_meeg:
+                if item_name not in group_files:
+                    item = QListWidgetItem(item_name)
+                    item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+                    item.setCheckState(Qt.Unchecked)
+                    self.listw.addItem(item)
+        finally:
+            self.listw.blockSignals(False)
+            self.listw.setUpdatesEnabled(True)
 
     def clear(self):
         for idx in range(self.listw.count()):
@@ -1208,23 +1216,26 @@ class SubBadsWidget(QWidget):
         self.setLayout(self.layout)
 
     def update_selection(self):
-        # Clear entries
-        for bt in self.bad_chkbts:
-            self.bad_chkbts[bt].setChecked(False)
-
-        # Catch Channels, which are present in meeg_bad_channels,
-        # but not in bad_chkbts
-        # Then load existing bads for choice
-        for bad in self.current_obj.bad_channels:
-            if bad in self.bad_chkbts:
-                self.bad_chkbts[bad].setChecked(True)
-            else:
-                # Remove bad channel from bad_channels if not existing
-                # in bad_chkbts (and thus not in ch_names)
-                self.current_obj.bad_channels.remove(bad)
+        # Repaint the checkboxes once after all states are set
+        self.bt_scroll.setUpdatesEnabled(False)
+        try:
+            # Catch Channels, which are present in meeg_bad_channels,
+            # but not in bad_chkbts
+            # Then load existing bads for choice
+            bad_channels = self.current_obj.bad_channels
+            # Iterate over a copy to remove missing channels in place
+            for bad in list(bad_channels):
+                if bad not in self.bad_chkbts:
+                    # Remove bad channel from bad_channels if not existing
+                    # in bad_chkbts (and thus not in ch_names)
+                    bad_channels.remove(bad)
+            bad_set = set(bad_channels)
+            for ch_name, chkbt in self.bad_chkbts.items():
+                chkbt.setChecked(ch_name in bad_set)
+        finally:
+            self.bt_scroll.setUpdatesEnabled(True)
 
     def _make_bad_chbxs(self, info):
-        time.sleep(1)
         # Store info in dictionary
         self.info_dict[self.current_obj.name] = info
 
@@ -1246,11 +1257,12 @@ class SubBadsWidget(QWidget):
             chkbt.setSizePolicy(QSizePolicy.Maximum, QSizePolicy.Maximum)
             chkbt.clicked.connect(self.bad_ckbx_assigned)
             self.bad_chkbts[ch_name] = chkbt
-            h_size += chkbt.sizeHint().width()
+            chkbt_width = chkbt.sizeHint().width()
+            h_size += chkbt_width
             if h_size > max_h_size:
                 column = 0
                 row += 1
-                h_size = chkbt.sizeHint().width()
+                h_size = chkbt_width
             self.chbx_layout.addWidget(chkbt, row, column)
             column += 1
 
@@ -1287,12 +1299,14 @@ class SubBadsWidget(QWidget):
         self.make_bad_chbxs()
 
     def bad_ckbx_assigned(self):
-        bad_channels = [ch for ch in self.bad_chkbts if self.bad_chkbts[ch].isChecked()]
+        bad_channels = [
+            ch for ch, chkbt in self.bad_chkbts.items() if chkbt.isChecked()
+        ]
         self.current_obj.set_bad_channels(bad_channels)
 
     def set_chkbx_enable(self, enable):
-        for chkbx in self.bad_chkbts:
-            self.bad_chkbts[chkbx].setEnabled(enable)
+        for chkbx in self.bad_chkbts.values():
+            chkbx.setEnabled(enable)
 
     def get_selected_bads(self, _, meeg, raw, raw_type):
         self.current_obj.set_bad_channels(raw.info["bads"])
@@ -1519,8 +1533,8 @@ class EventIDGui(QDialog):
             label_text = f"events found: {np.unique(events[:, 2])}"
 
         try:
-            # Load epochs from File
-            epochs = meeg.load_epochs()
+            # Only read the header of the epochs-file to check for metadata
+            epochs = meeg.load_epochs(preload=False)
             assert epochs.metadata is not None
         except (FileNotFoundError, AssertionError):
             self.query_widget.setEnabled(False)
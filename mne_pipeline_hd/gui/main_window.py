@@ -8,13 +8,13 @@ import sys
 from functools import partial
 
 import mne
-import pandas as pd
 from qtpy import compat
-from qtpy.QtCore import Qt, Signal
+from qtpy.QtCore import Qt, QTimer, Signal
 from qtpy.QtGui import QFont
 from qtpy.QtWidgets import (
     QAction,
     QApplication,
+    QButtonGroup,
     QComboBox,
     QGridLayout,
     QGroupBox,
@@ -107,6 +107,13 @@ class MainWindow(QMainWindow):
         self.pr = controller.pr
         self.edu_tour = None
         self.bt_dict = dict()
+        # Identify the currently built function-buttons and their layout
+        self.func_widgets_key = None
+        self.func_bts_key = None
+        # Functions and built group-boxes with the function-buttons for each tab
+        self.func_tab_funcs = dict()
+        self.func_tab_groups = dict()
+        self.func_bt_group = None
         # For functions, which should or should not
         # be called durin initialization
         self.first_init = True
@@ -114,6 +121,11 @@ class MainWindow(QMainWindow):
         self.pipeline_running = False
         # For the closeEvent to avoid showing the MessageBox when restarting
         self.restarting = False
+        # Rearrange the function-buttons only once after resizing stopped
+        self.resize_timer = QTimer(self)
+        self.resize_timer.setSingleShot(True)
+        self.resize_timer.setInterval(120)
+        self.resize_timer.timeout.connect(self.update_func_bts)
 
         # Set geometry to ratio of screen-geometry
         # (before adding func-buttons to allow adjustment to size)
@@ -126,10 +138,19 @@ class MainWindow(QMainWindow):
         self.init_main_widget()
         self.init_edu()
 
-        center(self)
+        # Show only once everything is added (one layout-pass)
+        self.show()
+        # Center and rearrange the function-buttons for the real width
+        # after the event loop has processed the pending geometry-changes
+        # (the resizeEvents during initialization are ignored)
+        QTimer.singleShot(0, self.center_window)
+        QTimer.singleShot(0, self.update_func_bts)
 
         self.first_init = False
 
+    def center_window(self):
+        center(self)
+
     def update_project_ui(self):
         # Redraw function-buttons and parameter-widgets
         self.redraw_func_and_param()
@@ -465,13 +486,9 @@ class MainWindow(QMainWindow):
         self.centralWidget().setLayout(self.general_layout)
 
         self.tab_func_widget = QTabWidget()
+        self.tab_func_widget.currentChanged.connect(self.func_tab_changed)
         self.general_layout.addWidget(self.tab_func_widget, 0, 0, 1, 3)
 
-        # Show already here to get the width of tab_func_widget to fit
-        # the function-groups inside
-        self.show()
-        self.general_layout.invalidate()
-
         # Add Function-Buttons
         self.add_func_bts()
 
@@ -494,77 +511,186 @@ class MainWindow(QMainWindow):
 
     # Todo: Make Buttons more appealing, mark when check
     #   make button-dependencies
-    def add_func_bts(self):
+    def _get_func_bts_width(self):
+        if self.isVisible():
+            return self.tab_func_widget.geometry().width()
+        else:
+            # Before the window is shown (no layout yet),
+            # take the window-width without the docks
+            return (
+                self.width()
+                - self.file_dock.sizeHint().width()
+                - self.parameters_dock.sizeHint().width()
+            )
+
+    def _get_func_bts_key(self):
+        # The function-buttons only need to be rebuilt,
+        # if the functions or the selected modules change
+        # (a changed width only requires to rearrange them)
+        return (
+            self.ct.pd_funcs_version,
+            frozenset(self.ct.get_setting("selected_modules")),
+            self._get_func_bts_width(),
+        )
+
+    def _build_func_widgets(self):
+        """Prepare the functions for each tab and group
+        (the widgets for a tab are built when it is shown first)."""
+        self.func_widgets_key = self._get_func_bts_key()[:2]
+        self.bt_dict = dict()
+        # Group-boxes of the tabs, which are already built
+        self.func_tab_groups = dict()
+        # One non-exclusive button-group with the button-ids as index
+        # of func_bt_names instead of a connection for each button
+        if self.func_bt_group is not None:
+            self.func_bt_group.deleteLater()
+        self.func_bt_group = QButtonGroup(self)
+        self.func_bt_group.setExclusive(False)
+        self.func_bt_group.idClicked.connect(self.func_bt_clicked)
+        self.func_bt_names = list()
         # Drop custom-modules, which aren't selected
-        cleaned_pd_funcs = self.ct.pd_funcs.loc[
-            self.ct.pd_funcs["module"].isin(self.ct.get_setting("selected_modules"))
-        ].copy()
-        # Horizontal Border for Function-Groups
-        max_h_size = self.tab_func_widget.geometry().width()
-
-        # Assert, that cleaned_pd_funcs is not empty
-        # (possible, when deselecting all modules)
-        if len(cleaned_pd_funcs) != 0:
-            tabs_grouped = cleaned_pd_funcs.groupby("tab")
-            # Add tabs
-            for tab_name, group in tabs_grouped:
-                group_grouped = group.groupby("group", sort=False)
-                tab = QScrollArea()
-                child_w = QWidget()
-                tab_v_layout = QVBoxLayout()
+        # (only the columns needed for the buttons are selected, no copy is needed
+        # because the frame is only read here)
+        module_mask = self.ct.pd_funcs["module"].isin(self.func_widgets_key[1])
+        cleaned_pd_funcs = self.ct.pd_funcs.loc[module_mask, ["tab", "group", "alias"]]
+        # Resolve the button-labels for all functions at once
+        self.func_alias_names = (
+            cleaned_pd_funcs["alias"]
+            .fillna(cleaned_pd_funcs.index.to_series())
+            .to_dict()
+        )
+        # Bucket the functions by tab and group in one pass
+        # (same order as with groupby: tabs sorted,
+        # groups and functions in order of appearance)
+        tab_groups = dict()
+        bucket_funcs = cleaned_pd_funcs.dropna(subset=["tab", "group"])
+        for function, tab_name, function_group in zip(
+            bucket_funcs.index, bucket_funcs["tab"], bucket_funcs["group"]
+        ):
+            tab_groups.setdefault(tab_name, dict()).setdefault(
+                function_group, list()
+            ).append(function)
+        self.func_tab_funcs = {t: tab_groups[t] for t in sorted(tab_groups)}
+
+    def _build_func_tab(self, tab_name):
+        """Create the group-boxes with the function-buttons for one tab."""
+        sel_functions = set(self.pr.sel_functions)
+        self.func_tab_groups[tab_name] = list()
+        # Add groupbox for each group
+        for function_group, group_funcs in self.func_tab_funcs[tab_name].items():
+            group_box = QGroupBox(function_group, self)
+            group_box.setSizePolicy(QSizePolicy.Maximum, QSizePolicy.Maximum)
+            setattr(self, f"{function_group}_gbox", group_box)
+            group_box.setCheckable(True)
+            # Bind the functions of this group-box (group-names are not unique
+            # across tabs, e.g. "Forward" exists in Compute and Plot)
+            group_box.toggled.connect(partial(self.func_group_toggled, group_funcs))
+            group_box_layout = QVBoxLayout()
+            # Add button for each function
+            for function in group_funcs:
+                pb = QPushButton(self.func_alias_names[function])
+                pb.setCheckable(True)
+                self.bt_dict[function] = pb
+                if function in sel_functions:
+                    pb.setChecked(True)
+                self.func_bt_group.addButton(pb, len(self.func_bt_names))
+                self.func_bt_names.append(function)
+                group_box_layout.addWidget(pb)
+
+            group_box.setLayout(group_box_layout)
+            self.func_tab_groups[tab_name].append(group_box)
+
+    def _layout_func_tab(self, tab, tab_name, max_h_size):
+        """Arrange the group-boxes of a tab in rows which fit into max_h_size."""
+        child_w = QWidget()
+        tab_v_layout = QVBoxLayout()
+        tab_h_layout = QHBoxLayout()
+        h_size = 0
+        for group_box in self.func_tab_groups[tab_name]:
+            # sizeHint has to go through all buttons of the group-box
+            group_width = group_box.sizeHint().width()
+            h_size += group_width
+            # Never add an empty row (group-box wider than max_h_size)
+            if h_size > max_h_size and tab_h_layout.count() > 0:
+                tab_v_layout.addLayout(tab_h_layout)
+                h_size = group_width
                 tab_h_layout = QHBoxLayout()
-                h_size = 0
-                # Add groupbox for each group
-                for function_group, _ in group_grouped:
-                    group_box = QGroupBox(function_group, self)
-                    group_box.setSizePolicy(QSizePolicy.Maximum, QSizePolicy.Maximum)
-                    setattr(self, f"{function_group}_gbox", group_box)
-                    group_box.setCheckable(True)
-                    group_box.toggled.connect(self.func_group_toggled)
-                    group_box_layout = QVBoxLayout()
-                    # Add button for each function
-                    for function in group_grouped.groups[function_group]:
-                        if pd.notna(cleaned_pd_funcs.loc[function, "alias"]):
-                            alias_name = cleaned_pd_funcs.loc[function, "alias"]
-                        else:
-                            alias_name = function
-                        pb = QPushButton(alias_name)
-                        pb.setCheckable(True)
-                        self.bt_dict[function] = pb
-                        if function in self.pr.sel_functions:
-                            pb.setChecked(True)
-                        pb.clicked.connect(partial(self.func_selected, function))
-                        group_box_layout.addWidget(pb)
-
-                    group_box.setLayout(group_box_layout)
-                    h_size += group_box.sizeHint().width()
-                    if h_size > max_h_size:
-                        tab_v_layout.addLayout(tab_h_layout)
-                        h_size = group_box.sizeHint().width()
-                        tab_h_layout = QHBoxLayout()
-                    tab_h_layout.addWidget(
-                        group_box, alignment=Qt.AlignLeft | Qt.AlignTop
-                    )
-
-                if tab_h_layout.count() > 0:
-                    tab_v_layout.addLayout(tab_h_layout)
+            tab_h_layout.addWidget(group_box, alignment=Qt.AlignLeft | Qt.AlignTop)
+
+        if tab_h_layout.count() > 0:
+            tab_v_layout.addLayout(tab_h_layout)
+
+        child_w.setLayout(tab_v_layout)
+        tab.setWidget(child_w)
+
+    def _layout_func_widgets(self, max_h_size):
+        """Add a tab for each tab-name (only filled, if it was already built)."""
+        for tab_name in self.func_tab_funcs:
+            tab = QScrollArea()
+            if tab_name in self.func_tab_groups:
+                self._layout_func_tab(tab, tab_name, max_h_size)
+            self.tab_func_widget.addTab(tab, tab_name)
+
+    def func_tab_changed(self, index):
+        # Build the contents of a tab when it is shown for the first time
+        if index >= 0:
+            tab_name = list(self.func_tab_funcs)[index]
+            if tab_name not in self.func_tab_groups:
+                self._build_func_tab(tab_name)
+                self._layout_func_tab(
+                    self.tab_func_widget.widget(index), tab_name, self.func_bts_key[2]
+                )
 
-                child_w.setLayout(tab_v_layout)
-                tab.setWidget(child_w)
-                self.tab_func_widget.addTab(tab, tab_name)
+    def add_func_bts(self):
+        self.func_bts_key = self._get_func_bts_key()
+        # Avoid repainting and tab-signals for every widget added
+        self.tab_func_widget.setUpdatesEnabled(False)
+        self.tab_func_widget.blockSignals(True)
+        try:
+            if self.func_bts_key[:2] != self.func_widgets_key:
+                self._build_func_widgets()
+            # Horizontal Border for Function-Groups
+            self._layout_func_widgets(self.func_bts_key[2])
+            # Build the current tab (signals are blocked here)
+            self.func_tab_changed(self.tab_func_widget.currentIndex())
+        finally:
+            self.tab_func_widget.blockSignals(False)
+            self.tab_func_widget.setUpdatesEnabled(True)
 
     def update_func_bts(self):
-        # Remove tabs in tab_func_widget
-        while self.tab_func_widget.count():
-            tab = self.tab_func_widget.removeTab(0)
-            if tab:
-                try:
-                    tab.deleteLater()
-                except RuntimeError:
-                    logger().debug("Tab already deleted")
-        self.bt_dict = dict()
-
-        self.add_func_bts()
+        # Keep the existing buttons and only update their check-state
+        # (e.g. for a changed project or a resize, which keeps the width)
+        if self._get_func_bts_key() == self.func_bts_key:
+            self.update_selected_funcs()
+            return
+
+        # Suspend repainting and tab-signals also while removing the old tabs
+        self.tab_func_widget.setUpdatesEnabled(False)
+        self.tab_func_widget.blockSignals(True)
+        try:
+            # Keep the group-boxes to only rearrange them (e.g. after a resize),
+            # if the functions didn't change (otherwise delete them with the tabs)
+            if self._get_func_bts_key()[:2] == self.func_widgets_key:
+                for group_boxes in self.func_tab_groups.values():
+                    for group_box in group_boxes:
+                        group_box.setParent(self)
+            else:
+                self.func_widgets_key = None
+            # Remove tabs in tab_func_widget
+            while self.tab_func_widget.count():
+                tab = self.tab_func_widget.widget(0)
+                self.tab_func_widget.removeTab(0)
+                if tab:
+                    try:
+                        tab.deleteLater()
+                    except RuntimeError:
+                        logger().debug("Tab already deleted")
+
+            self.add_func_bts()
+            self.update_selected_funcs()
+        finally:
+            self.tab_func_widget.blockSignals(False)
+            self.tab_func_widget.setUpdatesEnabled(True)
 
     def redraw_func_and_param(self):
         self.update_func_bts()
@@ -580,19 +706,27 @@ class MainWindow(QMainWindow):
     def func_selected(self, function):
         self._update_selected_functions(function, self.bt_dict[function].isChecked())
 
-    def func_group_toggled(self):
-        for function in self.bt_dict:
-            self._update_selected_functions(
-                function,
-                self.bt_dict[function].isChecked()
-                and self.bt_dict[function].isEnabled(),
-            )
+    def func_bt_clicked(self, bt_id):
+        self.func_selected(self.func_bt_names[bt_id])
+
+    def func_group_toggled(self, group_funcs, checked):
+        group_sel = {f for f in group_funcs if checked and self.bt_dict[f].isChecked()}
+        # Membership is checked against sets (sel_functions is a list)
+        group_set = set(group_funcs)
+        sel_functions = set(self.pr.sel_functions)
+        self.pr.sel_functions[:] = [
+            f for f in self.pr.sel_functions if f in group_sel or f not in group_set
+        ]
+        self.pr.sel_functions.extend(
+            f for f in group_funcs if f in group_sel and f not in sel_functions
+        )
 
     def update_selected_funcs(self):
-        for function in self.bt_dict:
-            self.bt_dict[function].setChecked(False)
-            if function in self.pr.sel_functions:
-                self.bt_dict[function].setChecked(True)
+        sel_functions = set(self.pr.sel_functions)
+        for function, pb in self.bt_dict.items():
+            checked = function in sel_functions
+            if pb.isChecked() != checked:
+                pb.setChecked(checked)
 
     def init_docks(self):
         if self.ct.edu_program:
@@ -663,9 +797,9 @@ class MainWindow(QMainWindow):
             self.showFullScreen()
 
     def clear(self):
-        for x in self.bt_dict:
-            self.bt_dict[x].setChecked(False)
         self.pr.sel_functions.clear()
+        # Only unchecks the buttons which are checked
+        self.update_selected_funcs()
 
     def start(self):
         if self.pipeline_running:
@@ -689,11 +823,13 @@ class MainWindow(QMainWindow):
 
     def update_pipeline(self, version):
         if version == "stable":
-            command = "pip install --upgrade mne_pipeline_hd"
+            pip_args = ["install", "--upgrade", "mne_pipeline_hd"]
         else:
-            command = (
-                "pip install " "https://github.com/marsipu/mne-pipeline-hd/zipball/main"
-            )
+            pip_args = [
+                "install",
+                "https://github.com/marsipu/mne-pipeline-hd/zipball/main",
+            ]
+        command = " ".join(["pip"] + pip_args)
         if iswin and not _run_from_script():
             QMessageBox.information(
                 self,
@@ -702,9 +838,11 @@ class MainWindow(QMainWindow):
                 f'and type "{command}" into the terminal!',
             )
         else:
+            # Run pip from the running interpreter
+            # (no PATH-lookup and no splitting of paths with spaces)
             QProcessDialog(
                 self,
-                command,
+                [[sys.executable, "-m", "pip"] + pip_args],
                 show_buttons=True,
                 show_console=True,
                 close_directly=True,
@@ -723,10 +861,9 @@ class MainWindow(QMainWindow):
                 self.restart()
 
     def update_mne(self):
-        command = "pip install --upgrade mne"
         QProcessDialog(
             self,
-            command,
+            [[sys.executable, "-m", "pip", "install", "--upgrade", "mne"]],
             show_buttons=True,
             show_console=True,
             close_directly=True,
@@ -751,7 +888,7 @@ class MainWindow(QMainWindow):
 
     def resizeEvent(self, event):
         if not self.first_init:
-            self.update_func_bts()
+            self.resize_timer.start()
         event.accept()
 
     def closeEvent(self, event):
@@ -23,6 +23,16 @@ from mne_pipeline_hd.pipeline.pipeline_utils import logger
 
 # ToDo: Merge models and base widgets
 
+# Brushes returned from data() are created once instead of on every call
+_file_status_brushes = {
+    "missing": QBrush(Qt.darkRed),
+    "exists": QBrush(Qt.green),
+    "possible_conflict": QBrush(Qt.lightGray),
+    "critical_conflict": QBrush(Qt.darkYellow),
+}
+_run_foreground_brushes = {0: QBrush(Qt.darkGray), 2: QBrush(Qt.green)}
+_run_background_brush = QBrush(Qt.darkGreen)
+
 
 class BaseListModel(QAbstractListModel):
     """A basic List-Model
@@ -847,13 +857,9 @@ class FileManagementModel(BasePandasModel):
 
         elif role == Qt.BackgroundRole:
             if pd.isna(value) or value == 0:
-                return QBrush(Qt.darkRed)
-            elif value == "exists":
-                return QBrush(Qt.green)
-            elif value == "possible_conflict":
-                return QBrush(Qt.lightGray)
-            elif value == "critical_conflict":
-                return QBrush(Qt.darkYellow)
+                return _file_status_brushes["missing"]
+            elif value in _file_status_brushes:
+                return _file_status_brushes[value]
 
 
 class CustomFunctionModel(QAbstractListModel):
@@ -924,15 +930,12 @@ class RunModel(QAbstractListModel):
         # 2 = Currently Runnning
         # Return Foreground depending on state of object/function
         elif role == Qt.ForegroundRole:
-            if self.getValue(index) == 0:
-                return QBrush(Qt.darkGray)
-            elif self.getValue(index) == 2:
-                return QBrush(Qt.green)
+            return _run_foreground_brushes.get(self.getValue(index))
 
         # Return Background depending on state of object/function
         elif role == Qt.BackgroundRole:
             if self.getValue(index) == 2:
-                return QBrush(Qt.darkGreen)
+                return _run_background_brush
 
         # Mark objects/functions if they are already done,
         # mark objects according to their type (color-code)
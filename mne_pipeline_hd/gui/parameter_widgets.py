@@ -11,7 +11,6 @@ from functools import partial
 import mne
 import numpy as np
 import pandas as pd
-from mne_qt_browser._pg_figure import _get_color
 from qtpy import compat
 from qtpy.QtCore import Qt, Signal
 from qtpy.QtGui import QFontDatabase, QFont, QPixmap
@@ -1717,6 +1716,9 @@ class ColorGui(Param):
         self.init_ui(layout)
 
     def _change_display_color(self):
+        # Imported here, because importing the Qt raw-browser is slow
+        from mne_qt_browser._pg_figure import _get_color
+
         key = self.select_widget.currentText()
         if key in self._cached_value:
             color = _get_color(self._cached_value[key])
@@ -1735,6 +1737,8 @@ class ColorGui(Param):
         return self._cached_value
 
     def _pick_color(self):
+        from mne_qt_browser._pg_figure import _get_color
+
         key = self.select_widget.currentText()
         if key in self._cached_value:
             previous_color = _get_color(self._cached_value[key])
@@ -2198,7 +2202,8 @@ class SettingsDlg(QDialog):
                 "data_type": "QSettings",
                 "gui_kwargs": {
                     "alias": "Enable CUDA",
-                    "description": "Enable for CUDA support "
+                    "description": "Enable for CUDA support, falls back to "
+                    "the CPU if no CUDA-device is found "
                     "(system has to be setup for cuda "
                     "as in https://mne.tools/stable/install/"
                     "advanced.html#gpu-acceleration-with-cuda)",
@@ -11,8 +11,6 @@ from os.path import join, isfile
 from matplotlib import pyplot as plt
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
 from matplotlib.figure import Figure
-from mne.viz import Brain
-from mne_qt_browser._pg_figure import MNEQtBrowser
 from qtpy.QtCore import Qt, QThreadPool
 from qtpy.QtGui import QPixmap, QFont
 from qtpy.QtWidgets import (
@@ -35,11 +33,6 @@ from qtpy.QtWidgets import (
 )
 
 from mne_pipeline_hd.pipeline.pipeline_utils import logger
-
-try:
-    from mne.viz import Figure3D
-except ImportError:
-    Figure3D = None
 from mne_pipeline_hd import _object_refs
 from mne_pipeline_hd.gui.base_widgets import SimpleList, CheckList
 from mne_pipeline_hd.gui.gui_utils import Worker, set_ratio_geometry
@@ -97,6 +90,17 @@ class PlotManager(QMainWindow):
             self.func_list.model._data.append(func_name)
             self.func_list.content_changed()
 
+        # Imported here, because loading the 3D-backend of mne
+        # and the Qt raw-browser is slow
+        # and not needed when only matplotlib-figures are shown
+        from mne.viz import Brain
+        from mne_qt_browser._pg_figure import MNEQtBrowser
+
+        try:
+            from mne.viz import Figure3D
+        except ImportError:
+            Figure3D = Brain
+
         for subplot in plot:
             if isinstance(subplot, Figure):
                 plot_widget = FigureCanvasQTAgg(subplot)
@@ -24,23 +24,31 @@ from qtpy.QtWidgets import (
 
 from mne_pipeline_hd import _object_refs, extra
 from mne_pipeline_hd.gui.base_widgets import SimpleList
-from mne_pipeline_hd.gui.gui_utils import center, WorkerDialog, get_user_input_string
+from mne_pipeline_hd.gui.gui_utils import (
+    center,
+    ErrorDialog,
+    Worker,
+    WorkerDialog,
+    get_user_input_string,
+)
 from mne_pipeline_hd.gui.main_window import MainWindow
 from mne_pipeline_hd.pipeline.controller import Controller
 from mne_pipeline_hd.pipeline.pipeline_utils import QS
 
 
+def _init_controller():
+    try:
+        return Controller()
+    except RuntimeError:
+        return None
+
+
 class WelcomeWindow(QWidget):
     def __init__(self, controller=None):
         super().__init__()
         _object_refs["welcome_window"] = self
-        if controller is None:
-            try:
-                self.ct = Controller()
-            except RuntimeError:
-                self.ct = None
-        else:
-            self.ct = controller
+        self.ct = controller
+        self.init_worker = None
 
         self.init_ui()
         self.update_widgets()
@@ -48,6 +56,28 @@ class WelcomeWindow(QWidget):
         self.show()
         center(self)
 
+        # Loading the Controller (reading the function-tables and importing
+        # custom-modules) is done in a thread to show the window immediately.
+        if controller is None:
+            self.home_path_label.setText("Loading Home-Path...")
+            self.home_path_bt.setEnabled(False)
+            self.init_worker = Worker(_init_controller)
+            self.init_worker.signals.finished.connect(self.controller_loaded)
+            self.init_worker.signals.error.connect(self.controller_failed)
+            self.init_worker.start()
+
+    def controller_loaded(self, controller):
+        self.ct = controller
+        self.init_worker = None
+        self.home_path_bt.setEnabled(True)
+        self.update_widgets()
+
+    def controller_failed(self, exc_tuple):
+        self.init_worker = None
+        self.home_path_bt.setEnabled(True)
+        self.update_widgets()
+        ErrorDialog(exc_tuple, self, title="Error while loading the Home-Path")
+
     def init_ui(self):
         layout = QVBoxLayout()
         title_label = QLabel("Welcome to MNE-Pipeline!")
@@ -12,8 +12,8 @@ import re
 import shutil
 import sys
 import traceback
+from collections import ChainMap
 from importlib import reload, resources, import_module
-from os import listdir
 from os.path import isdir, join
 from pathlib import Path
 
@@ -23,12 +23,17 @@ import pandas as pd
 from mne_pipeline_hd import functions, extra
 from mne_pipeline_hd.gui.gui_utils import get_user_input_string
 from mne_pipeline_hd.pipeline.legacy import transfer_file_params_to_single_subject
-from mne_pipeline_hd.pipeline.pipeline_utils import QS, logger
+from mne_pipeline_hd.pipeline.pipeline_utils import QS, logger, read_pd_csv
 from mne_pipeline_hd.pipeline.project import Project
 
 home_dirs = ["custom_packages", "freesurfer", "projects"]
 project_dirs = ["_pipeline_scripts", "data", "figures"]
 
+# Patterns for the files of custom-packages
+pd_functions_pattern = re.compile(r".*_functions\.csv")
+pd_parameters_pattern = re.compile(r".*_parameters\.csv")
+custom_module_pattern = re.compile(r"(.+)(\.py)$")
+
 
 class Controller:
     def __init__(self, home_path=None, selected_project=None, edu_program_name=None):
@@ -60,15 +65,16 @@ class Controller:
         logger().info(f"Home-Path: {self.home_path}")
         QS().setValue("home_path", self.home_path)
         # Create subdirectories if not existing for a valid home_path
-        for subdir in [d for d in home_dirs if not isdir(join(self.home_path, d))]:
-            os.mkdir(join(self.home_path, subdir))
+        for subdir in home_dirs:
+            os.makedirs(join(self.home_path, subdir), exist_ok=True)
 
         # Get Project-Folders (recognized by distinct sub-folders)
         self.projects_path = join(self.home_path, "projects")
+        # (all() stops stat-ing at the first missing sub-folder)
         self.projects = [
-            p
-            for p in listdir(self.projects_path)
-            if all([isdir(join(self.projects_path, p, d)) for d in project_dirs])
+            entry.name
+            for entry in os.scandir(self.projects_path)
+            if entry.is_dir() and all(isdir(join(entry.path, d)) for d in project_dirs)
         ]
 
         # Initialize Subjects-Dir
@@ -96,23 +102,14 @@ class Controller:
 
         # Pandas-DataFrame for contextual data of basic functions
         # (included with program)
-        self.pd_funcs = pd.read_csv(
-            resources.files(extra) / "functions.csv",
-            sep=";",
-            index_col=0,
-            na_values=[""],
-            keep_default_na=False,
-        )
+        self.pd_funcs = read_pd_csv(resources.files(extra) / "functions.csv")
+        # Increase, whenever pd_funcs is replaced or edited
+        # (e.g. to rebuild the function-buttons)
+        self.pd_funcs_version = 0
 
         # Pandas-DataFrame for contextual data of parameters
         # for basic functions (included with program)
-        self.pd_params = pd.read_csv(
-            resources.files(extra) / "parameters.csv",
-            sep=";",
-            index_col=0,
-            na_values=[""],
-            keep_default_na=False,
-        )
+        self.pd_params = read_pd_csv(resources.files(extra) / "parameters.csv")
 
         # Import the basic- and custom-function-modules
         self.import_custom_modules()
@@ -155,6 +152,10 @@ class Controller:
             for setting in default_keys - s_keys:
                 self.settings[setting] = self.default_settings["settings"][setting]
 
+        # Lookup-view which falls back to the default-settings
+        # (writes go to self.settings as the first mapping)
+        self._settings_view = ChainMap(self.settings, self.default_settings["settings"])
+
         # Check integrity of QSettings-Keys
         QS().sync()
         qs_keys = set(QS().childKeys())
@@ -179,12 +180,7 @@ class Controller:
         QS().sync()
 
     def get_setting(self, setting):
-        try:
-            value = self.settings[setting]
-        except KeyError:
-            value = self.default_settings["settings"][setting]
-
-        return value
+        return self._settings_view[setting]
 
     def change_project(self, new_project):
         self.pr = Project(self, new_project)
@@ -286,6 +282,7 @@ class Controller:
             self.pd_funcs = self.pd_funcs.loc[
                 self.pd_funcs.index.isin(self.edu_program["functions"])
             ]
+            self.pd_funcs_version += 1
 
             # Change the Project-Scripts-Path to a new folder
             # to store the Education-Project-Scripts separately
@@ -315,34 +312,43 @@ class Controller:
 
         # Load basic-modules
         # Add functions to sys.path
-        sys.path.insert(0, str(Path(functions.__file__).parent))
+        # (only once, every entry in sys.path is searched for each import)
+        functions_path = str(Path(functions.__file__).parent)
+        if functions_path not in sys.path:
+            sys.path.insert(0, functions_path)
         basic_functions_list = [x for x in dir(functions) if "__" not in x]
         self.all_modules["basic"] = list()
         for module_name in basic_functions_list:
             self.all_modules["basic"].append(module_name)
 
+        # Collect the DataFrames of all custom-packages to concatenate them once
+        pd_funcs_list = [self.pd_funcs]
+        pd_params_list = [self.pd_params]
+        all_func_names = set(self.pd_funcs.index)
+        all_param_names = set(self.pd_params.index)
+
         # Load custom_modules
-        pd_functions_pattern = r".*_functions\.csv"
-        pd_parameters_pattern = r".*_parameters\.csv"
-        custom_module_pattern = r"(.+)(\.py)$"
         for directory in [
-            d for d in os.scandir(self.custom_pkg_path) if not d.name.startswith(".")
+            d
+            for d in os.scandir(self.custom_pkg_path)
+            if d.is_dir() and not d.name.startswith(".")
         ]:
             pkg_name = directory.name
             pkg_path = directory.path
             file_dict = {"functions": None, "parameters": None, "modules": list()}
             for file_name in [
-                f for f in listdir(pkg_path) if not f.startswith((".", "_"))
+                f.name
+                for f in os.scandir(pkg_path)
+                if f.is_file() and not f.name.startswith((".", "_"))
             ]:
-                functions_match = re.match(pd_functions_pattern, file_name)
-                parameters_match = re.match(pd_parameters_pattern, file_name)
-                custom_module_match = re.match(custom_module_pattern, file_name)
-                if functions_match:
+                if pd_functions_pattern.match(file_name):
                     file_dict["functions"] = join(pkg_path, file_name)
-                elif parameters_match:
+                elif pd_parameters_pattern.match(file_name):
                     file_dict["parameters"] = join(pkg_path, file_name)
-                elif custom_module_match and custom_module_match.group(1) != "__init__":
-                    file_dict["modules"].append(custom_module_match)
+                elif file_name.endswith(".py"):
+                    custom_module_match = custom_module_pattern.match(file_name)
+                    if custom_module_match.group(1) != "__init__":
+                        file_dict["modules"].append(custom_module_match)
 
             # Check, that there is a whole set for a custom-module
             # (module-file, functions, parameters)
@@ -351,10 +357,13 @@ class Controller:
                 functions_path = file_dict["functions"]
                 parameters_path = file_dict["parameters"]
                 correct_count = 0
+                # Add pkg-path to sys.path
+                if pkg_path not in sys.path:
+                    sys.path.insert(0, pkg_path)
                 for module_match in file_dict["modules"]:
                     module_name = module_match.group(1)
-                    # Add pkg-path to sys.path
-                    sys.path.insert(0, pkg_path)
+                    # Already imported modules are taken from sys.modules
+                    # (use reload_modules to apply changes)
                     try:
                         import_module(module_name)
                     except Exception:
@@ -369,20 +378,8 @@ class Controller:
                 # (otherwise don't append to pd_funcs and pd_params)
                 if len(file_dict["modules"]) == correct_count:
                     try:
-                        read_pd_funcs = pd.read_csv(
-                            functions_path,
-                            sep=";",
-                            index_col=0,
-                            na_values=[""],
-                            keep_default_na=False,
-                        )
-                        read_pd_params = pd.read_csv(
-                            parameters_path,
-                            sep=";",
-                            index_col=0,
-                            na_values=[""],
-                            keep_default_na=False,
-                        )
+                        read_pd_funcs = read_pd_csv(functions_path)
+                        read_pd_params = read_pd_csv(parameters_path)
                     except Exception:
                         traceback.print_exc()
                     else:
@@ -392,15 +389,15 @@ class Controller:
 
                         # Check, that there are no duplicates
                         pd_funcs_to_append = read_pd_funcs.loc[
-                            ~read_pd_funcs.index.isin(self.pd_funcs.index)
+                            ~read_pd_funcs.index.isin(all_func_names)
                         ]
-                        self.pd_funcs = pd.concat([self.pd_funcs, pd_funcs_to_append])
+                        pd_funcs_list.append(pd_funcs_to_append)
+                        all_func_names.update(pd_funcs_to_append.index)
                         pd_params_to_append = read_pd_params.loc[
-                            ~read_pd_params.index.isin(self.pd_params.index)
+                            ~read_pd_params.index.isin(all_param_names)
                         ]
-                        self.pd_params = pd.concat(
-                            [self.pd_params, pd_params_to_append]
-                        )
+                        pd_params_list.append(pd_params_to_append)
+                        all_param_names.update(pd_params_to_append.index)
 
             else:
                 missing_files = [key for key in file_dict if file_dict[key] is None]
@@ -408,6 +405,12 @@ class Controller:
                     f"Files for import of {pkg_name} " f"are missing: {missing_files}"
                 )
 
+        if len(pd_funcs_list) > 1:
+            self.pd_funcs = pd.concat(pd_funcs_list)
+            self.pd_funcs_version += 1
+        if len(pd_params_list) > 1:
+            self.pd_params = pd.concat(pd_params_list)
+
     def reload_modules(self):
         for pkg_name in self.all_modules:
             for module_name in self.all_modules[pkg_name]:
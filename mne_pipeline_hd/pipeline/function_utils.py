@@ -13,6 +13,7 @@ import sys
 from collections import OrderedDict
 from importlib import import_module
 from multiprocessing import Pipe
+from os.path import join
 
 from matplotlib import pyplot as plt
 from qtpy.QtCore import QThreadPool, QRunnable, Slot, QObject, Signal
@@ -21,7 +22,13 @@ from qtpy.QtWidgets import QAbstractItemView
 from mne_pipeline_hd.gui.base_widgets import TimedMessageBox
 from mne_pipeline_hd.gui.gui_utils import get_exception_tuple, ExceptionTuple, Worker
 from mne_pipeline_hd.pipeline.loading import BaseLoading, FSMRI, Group, MEEG
-from mne_pipeline_hd.pipeline.pipeline_utils import shutdown, ismac, QS, logger
+from mne_pipeline_hd.pipeline.pipeline_utils import (
+    shutdown,
+    ismac,
+    QS,
+    logger,
+    warm_file_cache,
+)
 
 
 def get_func(func_name, obj):
@@ -59,12 +66,14 @@ def get_arguments(func, obj):
             arguments[obj_name] = obj
 
     # Get the values for parameter-names
+    # (read QSettings-keys only once instead of for each argument)
+    qsettings_keys = set(QS().childKeys())
     for arg_name in arguments:
         if arg_name in obj.pa:
             arguments[arg_name] = obj.pa[arg_name]
         elif arg_name in obj.ct.settings:
             arguments[arg_name] = obj.ct.settings[arg_name]
-        elif arg_name in QS().childKeys():
+        elif arg_name in qsettings_keys:
             arguments[arg_name] = QS().value(arg_name)
 
     # Add additional keyword-arguments if added for function by user
@@ -153,6 +162,8 @@ class RunController:
         self.current_object = None
         self.loaded_fsmri = None
         self.current_func = None
+        # Functions already looked up by their name
+        self.func_cache = dict()
 
         self.prog_count = 0
         self.errors = list()
@@ -168,17 +179,18 @@ class RunController:
 
         # Lists of selected functions divided into object-types
         # (MEEG, FSMRI, ...)
+        sel_functions = set(self.ct.pr.sel_functions)
         self.sel_meeg_funcs = [
-            ff for ff in self.meeg_funcs.index if ff in self.ct.pr.sel_functions
+            ff for ff in self.meeg_funcs.index if ff in sel_functions
         ]
         self.sel_fsmri_funcs = [
-            mf for mf in self.fsmri_funcs.index if mf in self.ct.pr.sel_functions
+            mf for mf in self.fsmri_funcs.index if mf in sel_functions
         ]
         self.sel_group_funcs = [
-            gf for gf in self.group_funcs.index if gf in self.ct.pr.sel_functions
+            gf for gf in self.group_funcs.index if gf in sel_functions
         ]
         self.sel_other_funcs = [
-            of for of in self.other_funcs.index if of in self.ct.pr.sel_functions
+            of for of in self.other_funcs.index if of in sel_functions
         ]
 
         # Get a dict with all objects paired with their functions
@@ -224,6 +236,14 @@ class RunController:
             for other_func in self.sel_other_funcs:
                 self.all_steps.append(("", other_func))
 
+    def get_func(self, func_name, obj):
+        """Get the function for func_name (importing its module only once
+        for all objects)."""
+        if func_name not in self.func_cache:
+            self.func_cache[func_name] = get_func(func_name, obj)
+
+        return self.func_cache[func_name]
+
     def mark_current_items(self, status):
         # Mark current object with status
         self.all_objects[self.current_object.name]["status"] = status
@@ -256,6 +276,7 @@ class RunController:
                 else:
                     self.current_object = MEEG(self.current_obj_name, self.ct)
                 self.loaded_fsmri = self.current_object.fsmri
+                self.prefetch_next_meeg()
 
             elif self.current_type == "Group":
                 self.current_object = Group(self.current_obj_name, self.ct)
@@ -263,6 +284,21 @@ class RunController:
             elif self.current_type == "Other":
                 self.current_object = BaseLoading(self.current_obj_name, self.ct)
 
+    def prefetch_next_meeg(self):
+        """Let the OS read the raw-files of the next MEEG in the background
+        while the functions for the current MEEG are running."""
+        obj_names = list(self.all_objects)
+        next_names = obj_names[obj_names.index(self.current_obj_name) + 1 :]
+        for name in next_names:
+            if self.all_objects[name]["type"] == "MEEG":
+                save_dir = join(self.ct.pr.data_path, name)
+                paths = [
+                    join(save_dir, f"{name}-raw.fif"),
+                    join(save_dir, f"{name}_{self.ct.pr.p_preset}-filtered-raw.fif"),
+                ]
+                warm_file_cache(paths)
+                break
+
     def process_finished(self, result):
         # ToDo: tqdm-progressbar for headless-mode
         self.prog_count += 1
@@ -291,7 +327,7 @@ class RunController:
 
             # Run function in Multiprocessing-Pool
             kwds = dict()
-            kwds["func"] = get_func(self.current_func, self.current_object)
+            kwds["func"] = self.get_func(self.current_func, self.current_object)
             kwds["keywargs"] = get_arguments(kwds["func"], self.current_object)
 
             return kwds
@@ -299,21 +335,49 @@ class RunController:
         else:
             self.finished()
 
+    def _is_plot_func(self, func_name):
+        return bool(
+            self.ct.pd_funcs.loc[func_name, "matplotlib"]
+            or self.ct.pd_funcs.loc[func_name, "mayavi"]
+        )
+
+    def _split_plot_steps(self):
+        """Move the steps of plot-functions behind the compute-steps
+        of all objects of the same type (types keep their order)."""
+        ordered_steps = list()
+        for obj_type in ["FSMRI", "MEEG", "Group", "Other"]:
+            type_steps = [
+                step
+                for step in self.all_steps
+                if self.all_objects[step[0]]["type"] == obj_type
+            ]
+            ordered_steps += [s for s in type_steps if not self._is_plot_func(s[1])]
+            ordered_steps += [s for s in type_steps if self._is_plot_func(s[1])]
+        self.all_steps = ordered_steps
+
     def start(self):
         """No-Gui start method."""
+        # Run all computations first and render the plots afterwards
+        self._split_plot_steps()
+        show_plots = self.ct.get_setting("show_plots")
         for name, func in self.all_steps:
             self.current_obj_name = name
             self.current_func = func
             self.get_object()
             kwds = dict()
-            kwds["func"] = get_func(self.current_func, self.current_object)
+            kwds["func"] = self.get_func(self.current_func, self.current_object)
             kwds["keywargs"] = get_arguments(kwds["func"], self.current_object)
             logger().info(
                 f"########################################\n"
                 f"Running {self.current_func} for {self.current_obj_name}\n"
                 f"########################################\n"
             )
-            result = run_func(**kwds)
+            try:
+                result = run_func(**kwds)
+            finally:
+                # Don't keep figures open until the end of the run
+                if self._is_plot_func(self.current_func) and not show_plots:
+                    close_all()
 
             if isinstance(result, ExceptionTuple):
                 self.errors.append(
@@ -14,14 +14,15 @@ import json
 import os
 import pickle
 import shutil
+from copy import deepcopy
 from datetime import datetime
 from os import listdir, makedirs
 from os.path import exists, getsize, isdir, isfile, join
 from pathlib import Path
 
+import h5io
 import matplotlib.pyplot as plt
 import mne
-import mne_connectivity
 import numpy as np
 from tqdm import tqdm
 
@@ -50,6 +51,8 @@ def _get_data_type_from_func(self, func, method):
 
 
 def load_decorator(load_func):
+    load_signature = inspect.signature(load_func)
+
     @functools.wraps(load_func)
     def load_wrapper(self, *args, **kwargs):
         # Get matching data-type from IO-Dict
@@ -104,7 +107,11 @@ def load_decorator(load_func):
                         raise err
 
         # Save data in data-dict for machines with big RAM
-        if not QS().value("save_ram"):
+        # (not if the data wasn't read into memory)
+        preload = load_signature.bind(self, *args, **kwargs).arguments.get(
+            "preload", True
+        )
+        if not QS().value("save_ram") and preload:
             self.data_dict[data_type] = data
 
         return data
@@ -240,7 +247,7 @@ class BaseLoading:
         with open(self.file_parameters_path, "w") as file:
             json.dump(self.file_parameters, file, cls=TypedJSONEncoder, indent=4)
 
-    def save_file_params(self, path):
+    def save_file_params(self, path, function=None):
         # Check existence of path and append appendices for hemispheres
         if not isfile(path):
             if isfile(path + "-lh.stc"):
@@ -257,7 +264,8 @@ class BaseLoading:
                 self.file_parameters[file_name] = dict()
             # Get the name of the calling function (assuming it is 2 Frames
             # above when running in pipeline)
-            function = inspect.stack()[2][3]
+            if function is None:
+                function = inspect.stack()[2][3]
             self.file_parameters[file_name]["FUNCTION"] = function
 
             if function in self.ct.pd_funcs.index:
@@ -270,6 +278,18 @@ class BaseLoading:
                 for p_name in [p for p in self.pa if p in critical_params]:
                     self.file_parameters[file_name][p_name] = self.pa[p_name]
 
+                # Add additional keyword-arguments, the assigned FSMRI
+                # and the bad channels (copied to not change with them)
+                self.file_parameters[file_name]["ADD_KWARGS"] = deepcopy(
+                    self.pr.add_kwargs.get(function, dict())
+                )
+                if getattr(self, "fsmri", None) is not None:
+                    self.file_parameters[file_name]["FSMRI"] = self.fsmri.name
+                if getattr(self, "bad_channels", None) is not None:
+                    self.file_parameters[file_name]["BAD_CHANNELS"] = list(
+                        self.bad_channels
+                    )
+
             self.file_parameters[file_name]["NAME"] = self.name
 
             self.file_parameters[file_name]["TIME"] = str(datetime.now())
@@ -308,7 +328,17 @@ class BaseLoading:
                 # Make sure there are no spaces left
                 critical_params_str = critical_params_str.replace(" ", "")
                 critical_params = critical_params_str.split(",")
-                critical_params += ["FUNCTION", "NAME", "TIME", "SIZE", "P_PRESET"]
+                critical_params += [
+                    "FUNCTION",
+                    "NAME",
+                    "TIME",
+                    "SIZE",
+                    "P_PRESET",
+                    "ADD_KWARGS",
+                    "FSMRI",
+                    "BAD_CHANNELS",
+                    "ICA_EXCLUDE",
+                ]
 
                 for param in self.file_parameters[file_name]:
                     if param not in critical_params:
@@ -389,8 +419,7 @@ class BaseLoading:
                 dir_path = join(dir_path, trial)
 
             # Create not existent folders
-            if not isdir(dir_path):
-                makedirs(dir_path)
+            makedirs(dir_path, exist_ok=True)
 
             # Get file_name depending on present attributes
             base_name_sequence = [self.name, self.p_preset, plot_name]
@@ -684,8 +713,7 @@ class MEEG(BaseLoading):
 
         # Main save directory
         self.save_dir = join(self.pr.data_path, self.name)
-        if not isdir(self.save_dir):
-            os.mkdir(self.save_dir)
+        makedirs(self.save_dir, exist_ok=True)
 
         # Data-Paths
         self.raw_path = join(self.save_dir, f"{self.name}-raw.fif")
@@ -761,8 +789,12 @@ class MEEG(BaseLoading):
             trial: join(self.save_dir, f"{self.name}_{trial}_{self.p_preset}-stc")
             for trial in self.sel_trials
         }
+        # Morphed Source-Estimates are stored in one HDF5-file for each trial
+        # (instead of two .stc-files for each hemisphere)
         self.morphed_stc_paths = {
-            trial: join(self.save_dir, f"{self.name}_{trial}_{self.p_preset}-morphed")
+            trial: join(
+                self.save_dir, f"{self.name}_{trial}_{self.p_preset}-morphed-stc.h5"
+            )
             for trial in self.sel_trials
         }
         self.ecd_paths = {
@@ -776,15 +808,14 @@ class MEEG(BaseLoading):
             }
             for trial in self.sel_trials
         }
+        # Label-Time-Courses of all labels are stored in one HDF5-file
+        # for each trial
         self.ltc_paths = {
-            trial: {
-                label: join(
-                    self.save_dir,
-                    "label_time_course",
-                    f"{self.name}_{trial}_{self.p_preset}_{label}-ltc.npy",
-                )
-                for label in self.pa["target_labels"]
-            }
+            trial: join(
+                self.save_dir,
+                "label_time_course",
+                f"{self.name}_{trial}_{self.p_preset}-ltc.h5",
+            )
             for trial in self.sel_trials
         }
         self.con_paths = {
@@ -941,7 +972,24 @@ class MEEG(BaseLoading):
             "stcs": {
                 trial: join(self.save_dir, f"{self.name}_{trial}_{self.p_preset}")
                 for trial in self.sel_trials
-            }
+            },
+            "stcs_morphed": {
+                trial: join(
+                    self.save_dir, f"{self.name}_{trial}_{self.p_preset}-morphed"
+                )
+                for trial in self.sel_trials
+            },
+            "ltc_npy": {
+                trial: {
+                    label: join(
+                        self.save_dir,
+                        "label_time_course",
+                        f"{self.name}_{trial}_{self.p_preset}_{label}-ltc.npy",
+                    )
+                    for label in self.pa["target_labels"]
+                }
+                for trial in self.sel_trials
+            },
         }
 
     def init_sample(self):
@@ -993,9 +1041,7 @@ class MEEG(BaseLoading):
                     stcs.save(file_path)
             elif isfile(test_file_path) and not isfile(file_path):
                 logger().debug(f"Copying {data_type} from sample-dataset...")
-                folder = Path(file_path).parent
-                if not isdir(folder):
-                    os.mkdir(folder)
+                makedirs(Path(file_path).parent, exist_ok=True)
                 shutil.copy2(test_file_path, file_path)
                 logger().debug("Done!")
 
@@ -1054,8 +1100,8 @@ class MEEG(BaseLoading):
         return mne.io.read_info(self.raw_path)
 
     @load_decorator
-    def load_raw(self):
-        raw = mne.io.read_raw_fif(self.raw_path, preload=True)
+    def load_raw(self, preload=True):
+        raw = mne.io.read_raw_fif(self.raw_path, preload=preload)
         raw.info["bads"] = [bc for bc in self.bad_channels if bc in raw.ch_names]
         return raw
 
@@ -1100,9 +1146,9 @@ class MEEG(BaseLoading):
         mne.write_events(self.events_path, events, overwrite=True)
 
     @load_decorator
-    def load_epochs(self):
+    def load_epochs(self, preload=True):
         return mne.read_epochs(
-            self.epochs_path, proj=self.pa["apply_proj"], preload=True
+            self.epochs_path, proj=self.pa["apply_proj"], preload=preload
         )
 
     @save_decorator
@@ -1294,17 +1340,21 @@ class MEEG(BaseLoading):
     @load_decorator
     def load_morphed_source_estimates(self):
         morphed_stcs = dict()
-        for trial in self.morphed_stc_paths:
-            morphed_stcs[trial] = mne.source_estimate.read_source_estimate(
-                self.morphed_stc_paths[trial]
-            )
+        for trial, stc_path in self.morphed_stc_paths.items():
+            # Legacy: Read morphed Source-Estimates still stored as .stc-files
+            legacy_path = self.deprecated_paths["stcs_morphed"][trial]
+            if not isfile(stc_path) and isfile(legacy_path + "-lh.stc"):
+                stc_path = legacy_path
+            morphed_stcs[trial] = mne.source_estimate.read_source_estimate(stc_path)
 
         return morphed_stcs
 
     @save_decorator
     def save_morphed_source_estimates(self, morphed_stcs):
         for trial in morphed_stcs:
-            morphed_stcs[trial].save(self.morphed_stc_paths[trial], overwrite=True)
+            morphed_stcs[trial].save(
+                self.morphed_stc_paths[trial], ftype="h5", overwrite=True
+            )
 
     def load_mixn_dipoles(self):
         mixn_dips = dict()
@@ -1380,11 +1430,22 @@ class MEEG(BaseLoading):
     def load_ltc(self):
         ltcs = dict()
         for trial in self.sel_trials:
+            ltc_path = self.ltc_paths[trial]
+            if isfile(ltc_path):
+                trial_ltcs = h5io.read_hdf5(ltc_path)
+            else:
+                # Legacy: Read Label-Time-Courses stored in .npy-files
+                trial_ltcs = {
+                    label: np.load(npy_path)
+                    for label, npy_path in self.deprecated_paths["ltc_npy"][
+                        trial
+                    ].items()
+                    if isfile(npy_path)
+                }
             ltcs[trial] = dict()
-            for label in self.ltc_paths[trial]:
-                ltc_path = self.ltc_paths[trial][label]
-                if isfile(ltc_path):
-                    ltcs[trial][label] = np.load(ltc_path)
+            for label in self.pa["target_labels"]:
+                if label in trial_ltcs:
+                    ltcs[trial][label] = trial_ltcs[label]
                 else:
                     raise FileNotFoundError(
                         f"No Label-Time-Course found "
@@ -1400,11 +1461,13 @@ class MEEG(BaseLoading):
     @save_decorator
     def save_ltc(self, ltcs):
         for trial in ltcs:
-            for label in ltcs[trial]:
-                np.save(self.ltc_paths[trial][label], ltcs[trial][label])
+            h5io.write_hdf5(self.ltc_paths[trial], ltcs[trial], overwrite=True)
 
     @load_decorator
     def load_connectivity(self):
+        # Imported lazily, mne_connectivity takes long to import
+        import mne_connectivity
+
         con_dict = dict()
         for trial in self.con_paths:
             con_dict[trial] = dict()
@@ -1672,8 +1735,7 @@ class Group(BaseLoading):
     def init_paths(self):
         # Main Path
         self.save_dir = self.pr.save_dir_averages
-        if not isdir(self.save_dir):
-            os.mkdir(self.save_dir)
+        makedirs(self.save_dir, exist_ok=True)
 
         # Data Paths
         self.ga_evokeds_paths = {
@@ -1701,14 +1763,11 @@ class Group(BaseLoading):
             for trial in self.sel_trials
         }
         self.ga_ltc_paths = {
-            trial: {
-                label: join(
-                    self.save_dir,
-                    "label-time-courses",
-                    f"{self.name}_{trial}_" f"{self.p_preset}_{label}.npy",
-                )
-                for label in self.pa["target_labels"]
-            }
+            trial: join(
+                self.save_dir,
+                "label-time-courses",
+                f"{self.name}_{trial}_{self.p_preset}-ltc.h5",
+            )
             for trial in self.sel_trials
         }
         self.ga_con_paths = {
@@ -1753,7 +1812,19 @@ class Group(BaseLoading):
             },
         }
 
-        self.deprecated_paths = {}
+        self.deprecated_paths = {
+            "grand_avg_ltc_npy": {
+                trial: {
+                    label: join(
+                        self.save_dir,
+                        "label-time-courses",
+                        f"{self.name}_{trial}_" f"{self.p_preset}_{label}.npy",
+                    )
+                    for label in self.pa["target_labels"]
+                }
+                for trial in self.sel_trials
+            }
+        }
 
     ###########################################################################
     # Load- & Save-Methods
@@ -1795,7 +1866,11 @@ class Group(BaseLoading):
     def load_ga_tfr(self):
         ga_tfr = dict()
         for trial in self.sel_trials:
-            ga_tfr[trial] = mne.time_frequency.read_tfrs(self.ga_tfr_paths[trial])[0]
+            trial_tfr = mne.time_frequency.read_tfrs(self.ga_tfr_paths[trial])
+            # A file with a single TFR is read as a list in older MNE-versions
+            if isinstance(trial_tfr, list):
+                trial_tfr = trial_tfr[0]
+            ga_tfr[trial] = trial_tfr
 
         return ga_tfr
 
@@ -1820,21 +1895,29 @@ class Group(BaseLoading):
     @load_decorator
     def load_ga_ltc(self):
         ga_ltc = dict()
-        for trial in self.ga_ltc_paths:
-            ga_ltc[trial] = dict()
-            for label in self.ga_ltc_paths[trial]:
-                ga_ltc[trial][label] = np.load(self.ga_ltc_paths[trial][label])
+        for trial, ga_ltc_path in self.ga_ltc_paths.items():
+            if isfile(ga_ltc_path):
+                ga_ltc[trial] = h5io.read_hdf5(ga_ltc_path)
+            else:
+                # Legacy: Read Label-Time-Courses stored in .npy-files
+                ga_ltc[trial] = {
+                    label: np.load(npy_path)
+                    for label, npy_path in self.deprecated_paths["grand_avg_ltc_npy"][
+                        trial
+                    ].items()
+                }
 
         return ga_ltc
 
     @save_decorator
     def save_ga_ltc(self, ga_ltc):
         for trial in ga_ltc:
-            for label in ga_ltc[trial]:
-                np.save(self.ga_ltc_paths[trial][label], ga_ltc[trial][label])
+            h5io.write_hdf5(self.ga_ltc_paths[trial], ga_ltc[trial], overwrite=True)
 
     @load_decorator
     def load_ga_con(self):
+        import mne_connectivity
+
         ga_connect = dict()
         for trial in self.ga_con_paths:
             ga_connect[trial] = {}
@@ -5,7 +5,7 @@ License: BSD 3-Clause
 Github: https://github.com/marsipu/mne-pipeline-hd
 """
 
-from multiprocessing import Pool
+from multiprocessing import get_context
 
 mp_pool = None
 
@@ -20,4 +20,5 @@ def init_mp_pool():
     global mp_pool
 
     close_mp_pool()
-    mp_pool = Pool(1)
+    # Spawn the worker instead of forking the GUI-process with all its memory
+    mp_pool = get_context("spawn").Pool(1)
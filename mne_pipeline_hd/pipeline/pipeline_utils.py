@@ -14,11 +14,13 @@ import sys
 from ast import literal_eval
 from copy import deepcopy
 from datetime import datetime
+from functools import lru_cache
 from importlib import resources
-from os.path import join, isfile
+from os.path import getmtime, join, isfile
 from pathlib import Path
 
 import numpy as np
+import pandas as pd
 import psutil
 
 from mne_pipeline_hd import extra
@@ -68,6 +70,41 @@ def get_n_jobs(n_jobs):
     return n_cores
 
 
+_cuda_capable = None
+
+
+def get_cuda_n_jobs(n_jobs, enable_cuda):
+    """Get n_jobs="cuda" for MNE-functions supporting CUDA
+    if it is enabled and a CUDA-device is available"""
+    global _cuda_capable
+    if not enable_cuda:
+        return n_jobs
+    # Only initialize CUDA once
+    if _cuda_capable is None:
+        import mne
+
+        mne.cuda.init_cuda(ignore_config=True)
+        _cuda_capable = mne.cuda._cuda_capable
+        if not _cuda_capable:
+            logger().info("No CUDA-device available, falling back to CPU")
+
+    if _cuda_capable:
+        return "cuda"
+    else:
+        return n_jobs
+
+
+def warm_file_cache(paths):
+    """Ask the OS to read files into the page-cache in the background
+    (so loading them afterwards doesn't have to wait for the disk).
+    Without posix_fadvise (e.g. on Windows) nothing is done."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for path in [p for p in paths if isfile(p)]:
+        with open(path, "rb") as file:
+            os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+
+
 def encode_tuples(input_dict):
     """Encode tuples in a dictionary, because JSON does not recognize them
     (CAVE: input_dict is changed in place)"""
@@ -112,6 +149,17 @@ def type_json_hook(obj):
         return obj
 
 
+def _params_equal(previous_value, current_value):
+    """Compare parameter-values like they are stored in the file-parameters
+    (e.g. a tuple equals the list it becomes in the JSON-file)"""
+    try:
+        return json.dumps(
+            previous_value, cls=TypedJSONEncoder, sort_keys=True
+        ) == json.dumps(current_value, cls=TypedJSONEncoder, sort_keys=True)
+    except TypeError:
+        return str(previous_value) == str(current_value)
+
+
 def compare_filep(obj, path, target_parameters=None, verbose=True):
     """Compare the parameters of the previous run to the current
     parameters for the given path
@@ -162,7 +210,7 @@ def compare_filep(obj, path, target_parameters=None, verbose=True):
             previous_value = obj.file_parameters[file_name][param]
             current_value = obj.pa[param]
 
-            if str(previous_value) == str(current_value):
+            if _params_equal(previous_value, current_value):
                 result_dict[param] = "equal"
                 if verbose:
                     logger().debug(f"{param} equal for {file_name}")
@@ -198,6 +246,92 @@ def compare_filep(obj, path, target_parameters=None, verbose=True):
     return result_dict
 
 
+def is_up_to_date(obj, path, dependency_paths, function):
+    """Check if the file at path can be reused instead of being computed again
+
+    Parameters
+    ----------
+    obj : MEEG | FSMRI | Group
+        A Data-Object to get the information needed
+    path : str
+        The path for the file to check
+    dependency_paths : list
+        The paths of the files the file at path is computed from
+    function : str
+        The name of the function which computes the file at path
+
+    Returns
+    -------
+    up_to_date : bool
+        True, if the file exists and was saved by function, all parameters
+        of function (including additional keyword-arguments,
+        the assigned FSMRI and the bad channels) are unchanged
+        and no dependency was changed after the file was saved.
+    """
+    if not isfile(path) or obj.ct.settings["overwrite"]:
+        return False
+
+    file_params = obj.file_parameters.get(Path(path).name, dict())
+    if file_params.get("FUNCTION") != function:
+        return False
+
+    func_args = obj.ct.pd_funcs.loc[function, "func_args"].replace(" ", "")
+    target_parameters = [p for p in func_args.split(",") if p in obj.pa]
+    if target_parameters:
+        results = compare_filep(obj, path, target_parameters, verbose=False)
+        if any([results[key] != "equal" for key in results]):
+            return False
+
+    # Values, which are not part of the parameters
+    current_values = {"ADD_KWARGS": obj.pr.add_kwargs.get(function, dict())}
+    if getattr(obj, "fsmri", None) is not None:
+        current_values["FSMRI"] = obj.fsmri.name
+    if getattr(obj, "bad_channels", None) is not None:
+        current_values["BAD_CHANNELS"] = obj.bad_channels
+    for key, current_value in current_values.items():
+        if key not in file_params or not _params_equal(file_params[key], current_value):
+            return False
+
+    mtime = getmtime(path)
+    for dependency_path in [dp for dp in dependency_paths if dp is not None]:
+        if isfile(dependency_path) and getmtime(dependency_path) > mtime:
+            return False
+
+    return True
+
+
+# Only a few csv-files are read (the basic ones and those of custom packages)
+@lru_cache(maxsize=16)
+def _read_pd_csv(path, mtime_ns, size):
+    return pd.read_csv(
+        path,
+        sep=";",
+        index_col=0,
+        na_values=[""],
+        keep_default_na=False,
+    )
+
+
+def read_pd_csv(path):
+    """Read a functions-/parameters-csv into a DataFrame
+    (the file is only parsed again if it changed)
+
+    Parameters
+    ----------
+    path : str | Path
+        The path to the .csv-file
+
+    Returns
+    -------
+    pd_data : pd.DataFrame
+        A copy of the cached DataFrame (which can be changed safely).
+    """
+    path = str(path)
+    # Nanoseconds to notice a rewrite shortly after the last one
+    stat = os.stat(path)
+    return _read_pd_csv(path, stat.st_mtime_ns, stat.st_size).copy()
+
+
 def check_kwargs(kwargs, function):
     kwargs = kwargs.copy()
 
@@ -259,16 +393,31 @@ def _get_func_param_kwargs(func, params):
     return kwargs
 
 
+@lru_cache(maxsize=None)
+def _load_default_qsettings():
+    # QS() is instantiated for every access,
+    # so the default settings are only read once from disk
+    default_settings_path = join(resources.files(extra), "default_settings.json")
+    with open(default_settings_path, "r") as file:
+        return json.load(file)["qsettings"]
+
+
 class BaseSettings:
     def __init__(self):
         # Load default settings
-        default_settings_path = join(resources.files(extra), "default_settings.json")
-        with open(default_settings_path, "r") as file:
-            self.default_qsettings = json.load(file)["qsettings"]
+        self.default_qsettings = _load_default_qsettings()
+
+    def _get_default_type(self, name):
+        # Only the type is needed, so the default is not copied
+        if name in self.default_qsettings:
+            return type(self.default_qsettings[name])
+        # Raises for unknown settings
+        return type(self.get_default(name))
 
     def get_default(self, name):
         if name in self.default_qsettings:
-            return self.default_qsettings[name]
+            # Copy to keep the cached defaults unchanged
+            return deepcopy(self.default_qsettings[name])
         else:
             raise RuntimeError(
                 f"{name} not in default_settings.json! "
@@ -288,7 +437,7 @@ try:
             loaded_value = QSettings().value(setting, defaultValue=defaultValue)
             # Type-Conversion for UNIX-Systems
             # (ini-File does not preserve type, converts to strings)
-            if not isinstance(loaded_value, type(self.get_default(setting))):
+            if not isinstance(loaded_value, self._get_default_type(setting)):
                 try:
                     loaded_value = literal_eval(loaded_value)
                 except (SyntaxError, ValueError):
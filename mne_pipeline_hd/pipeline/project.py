@@ -70,9 +70,7 @@ class Project:
 
         # Create or check existence of main_paths
         for path in self.main_paths:
-            if not exists(path):
-                makedirs(path)
-                logger().debug(f"{path} created")
+            makedirs(path, exist_ok=True)
 
     def init_attributes(self):
         # Stores the names of all MEG/EEG-Files
@@ -237,6 +235,10 @@ class Project:
             self.sel_functions_path: self.old_sel_funcs_path,
         }
 
+        # List the pipeline-scripts once instead of probing each file with open()
+        with os.scandir(self.pscripts_path) as entries:
+            present_files = {entry.path for entry in entries}
+
         for path in [
             p
             for p in self.path_to_attribute
@@ -244,6 +246,8 @@ class Project:
         ]:
             attribute_name = self.path_to_attribute[path]
             try:
+                if path not in present_files:
+                    raise FileNotFoundError(path)
                 with open(path, "r") as file:
                     loaded_attribute = json.load(file, object_hook=type_json_hook)
                     # Make sure, that loaded object has same type
@@ -255,6 +259,8 @@ class Project:
             # Either empty file or no file, leaving default from __init__
             except (json.JSONDecodeError, FileNotFoundError):
                 # Old Paths to allow transition (22.11.2020)
+                if self.old_paths.get(path) not in present_files:
+                    continue
                 try:
                     with open(self.old_paths[path], "r") as file:
                         setattr(
@@ -272,14 +278,11 @@ class Project:
             ) as read_file:
                 loaded_parameters = json.load(read_file, object_hook=type_json_hook)
 
+                param_names = set(self.ct.pd_params.index)
                 for p_preset in loaded_parameters:
                     # Make sure, that only parameters,
                     # which exist in pd_params are loaded
-                    for param in [
-                        p
-                        for p in loaded_parameters[p_preset]
-                        if p not in self.ct.pd_params.index
-                    ]:
+                    for param in loaded_parameters[p_preset].keys() - param_names:
                         if "_exp" not in param:
                             loaded_parameters[p_preset].pop(param)
 
@@ -465,12 +468,11 @@ class Project:
         pass
 
     def check_data(self):
+        known_objects = set(self.all_meeg) | set(self.all_erm)
         missing_objects = [
             x
             for x in listdir(self.data_path)
-            if x != "grand_averages"
-            and x not in self.all_meeg
-            and x not in self.all_erm
+            if x != "grand_averages" and x not in known_objects
         ]
 
         for obj in missing_objects:
@@ -478,15 +480,16 @@ class Project:
 
         # Get Freesurfer-folders (with 'surf'-folder)
         # from subjects_dir (excluding .files for Mac)
-        read_dir = sorted(
-            [f for f in os.listdir(self.ct.subjects_dir) if not f.startswith(".")],
+        with os.scandir(self.ct.subjects_dir) as entries:
+            fsmri_entries = [
+                entry
+                for entry in entries
+                if not entry.name.startswith(".") and entry.is_dir()
+            ]
+        self.all_fsmri = sorted(
+            [entry.name for entry in fsmri_entries if exists(join(entry.path, "surf"))],
             key=str.lower,
         )
-        self.all_fsmri = [
-            fsmri
-            for fsmri in read_dir
-            if exists(join(self.ct.subjects_dir, fsmri, "surf"))
-        ]
 
         self.save()
 
@@ -4,10 +4,19 @@ Authors: Martin Schulz <dev@mgschulz.de>
 License: BSD 3-Clause
 Github: https://github.com/marsipu/mne-pipeline-hd
 """
-# from mne_pipeline_hd.pipeline.function_utils import RunController
-# from mne_pipeline_hd.pipeline.loading import MEEG
-#
-#
+
+import mne
+import numpy as np
+
+from mne_pipeline_hd.functions import operations
+from mne_pipeline_hd.functions.operations import (
+    grand_avg_morphed,
+    grand_avg_tfr,
+    morph_fsmri,
+)
+from mne_pipeline_hd.pipeline.function_utils import RunController
+from mne_pipeline_hd.pipeline.loading import FSMRI, MEEG, Group
+
 # def test_all_functions(controller):
 #     controller.pr.sel_functions = list(controller.pd_funcs.index)
 #     controller.sel_meeg = ['_sample_', '_test_']
@@ -31,3 +40,138 @@ Github: https://github.com/marsipu/mne-pipeline-hd
 #     meeg = MEEG('_sample_', controller)
 #     epochs = meeg.load_epochs()
 #     assert epochs.data.shape[1] == 37
+
+
+def _create_test_group(controller, n_meeg=3, trials=("A", "B")):
+    names = [f"_test{idx}_" for idx in range(n_meeg)]
+    for name in names:
+        controller.pr.add_meeg(name)
+        controller.pr.sel_event_id[name] = {trial: None for trial in trials}
+    controller.pr.all_groups["_test_group_"] = names
+    # Avoid fetching fsaverage
+    controller.pr.parameters[controller.pr.p_preset]["morph_to"] = "_test_fsmri_"
+
+    return [MEEG(name, controller) for name in names]
+
+
+def test_grand_avg_tfr(controller):
+    meegs = _create_test_group(controller)
+    rng = np.random.default_rng(0)
+    ch_names = ["EEG1", "EEG2", "EEG3"]
+    freqs = np.arange(5.0, 10.0)
+    times = np.arange(10) / 100
+    for idx, meeg in enumerate(meegs):
+        # The last MEEG is missing a channel
+        meeg_ch_names = ch_names[:2] if idx == len(meegs) - 1 else ch_names
+        info = mne.create_info(meeg_ch_names, 100.0, "eeg")
+        powers = [
+            mne.time_frequency.AverageTFRArray(
+                info,
+                rng.random((len(meeg_ch_names), len(freqs), len(times))),
+                times,
+                freqs,
+                nave=10,
+                comment=trial,
+            )
+            for trial in meeg.sel_trials
+        ]
+        meeg.save_power_tfr_average(powers)
+
+    group = Group("_test_group_", controller)
+    grand_avg_tfr(group)
+    ga_tfr = Group("_test_group_", controller).load_ga_tfr()
+
+    # Compare to the grand-average from MNE
+    for trial in group.sel_trials:
+        powers = [
+            [pw for pw in meeg.load_power_tfr_average() if pw.comment == trial][0]
+            for meeg in meegs
+        ]
+        powers = [pw.pick(ch_names[:2]) for pw in powers]
+        mne_ga = mne.grand_average(powers)
+        assert ga_tfr[trial].ch_names == mne_ga.ch_names
+        assert ga_tfr[trial].nave == len(meegs)
+        np.testing.assert_allclose(ga_tfr[trial].data, mne_ga.data)
+
+
+def test_grand_avg_morphed(controller):
+    meegs = _create_test_group(controller)
+    rng = np.random.default_rng(0)
+    vertices = [np.arange(0, 20, 2), np.arange(1, 17, 3)]
+    all_stcs = list()
+    for meeg in meegs:
+        stcs = {
+            trial: mne.SourceEstimate(
+                rng.standard_normal((sum(len(v) for v in vertices), 5)),
+                vertices,
+                tmin=-0.1,
+                tstep=0.01,
+                subject="_test_fsmri_",
+            )
+            for trial in meeg.sel_trials
+        }
+        meeg.save_morphed_source_estimates(stcs)
+        all_stcs.append(stcs)
+
+    group = Group("_test_group_", controller)
+    grand_avg_morphed(group, "_test_fsmri_")
+    ga_stcs = Group("_test_group_", controller).load_ga_stc()
+
+    for trial in group.sel_trials:
+        mean_data = np.mean([stcs[trial].data for stcs in all_stcs], axis=0)
+        # The grand-average is computed and stored in single precision
+        np.testing.assert_allclose(ga_stcs[trial].data, mean_data, rtol=1e-5)
+
+
+def test_split_plot_steps(controller):
+    _create_test_group(controller)
+    controller.pr.sel_meeg = list(controller.pr.all_meeg)
+    controller.pr.sel_functions = ["plot_filtered", "filter_data", "find_events"]
+    rc = RunController(controller)
+    rc._split_plot_steps()
+
+    # Plot-steps run after the compute-steps of all objects
+    n_compute = 2 * len(controller.pr.sel_meeg)
+    compute_steps = rc.all_steps[:n_compute]
+    plot_steps = rc.all_steps[n_compute:]
+    assert {name for name, _ in compute_steps} == set(controller.pr.sel_meeg)
+    assert all(func in ["filter_data", "find_events"] for _, func in compute_steps)
+    assert [name for name, _ in plot_steps] == controller.pr.sel_meeg
+    assert all(func == "plot_filtered" for _, func in plot_steps)
+
+
+def test_morph_fsmri(controller, monkeypatch):
+    """MEEG-files of different FSMRIs get their own Source-Morph,
+    MEEG-files of the same FSMRI reuse the last one."""
+    meegs = _create_test_group(controller, n_meeg=3)
+    fsmri_names = ["_test_fsmri1_", "_test_fsmri2_", "_test_fsmri2_"]
+    for meeg, fsmri_name in zip(meegs, fsmri_names):
+        meeg.fsmri = FSMRI(fsmri_name, controller)
+
+    forward = {"src": [{"vertno": np.arange(10)}, {"vertno": np.arange(8)}]}
+    computed_morphs = list()
+    saved_morphs = dict()
+
+    def _compute_source_morph(src, subject_from, **kwargs):
+        morph = (subject_from, len(computed_morphs))
+        computed_morphs.append(morph)
+        return morph
+
+    def _save_source_morph(meeg, source_morph):
+        saved_morphs[meeg.name] = source_morph
+
+    monkeypatch.setattr(operations, "_last_source_morph", dict())
+    monkeypatch.setattr(operations.mne, "compute_source_morph", _compute_source_morph)
+    monkeypatch.setattr(MEEG, "load_forward", lambda meeg: forward)
+    monkeypatch.setattr(MEEG, "save_source_morph", _save_source_morph)
+    monkeypatch.setattr(FSMRI, "load_source_space", lambda fsmri: None)
+
+    for meeg in meegs:
+        morph_fsmri(meeg, "_test_morph_to_")
+
+    assert computed_morphs == [("_test_fsmri1_", 0), ("_test_fsmri2_", 1)]
+    assert saved_morphs == {
+        meegs[0].name: ("_test_fsmri1_", 0),
+        meegs[1].name: ("_test_fsmri2_", 1),
+        meegs[2].name: ("_test_fsmri2_", 1),
+    }
@@ -5,6 +5,9 @@ License: BSD 3-Clause
 Github: https://github.com/marsipu/mne-pipeline-hd
 """
 
+import os
+from os.path import isfile
+
 import pytest
 
 from mne_pipeline_hd.pipeline.pipeline_utils import logger
@@ -47,3 +50,116 @@ def test_kwargs_geopenfilenames():
 
     signature = inspect.signature(compat.getopenfilenames)
     assert "filters" in signature.parameters
+
+
+def _create_test_meeg(controller, name="_test_", trials=("A", "B")):
+    from mne_pipeline_hd.pipeline.loading import MEEG
+
+    controller.pr.add_meeg(name)
+    controller.pr.sel_event_id[name] = {trial: None for trial in trials}
+
+    return MEEG(name, controller)
+
+
+def _create_test_stc(seed=0):
+    import mne
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    vertices = [np.arange(0, 20, 2), np.arange(1, 17, 3)]
+    data = rng.standard_normal((sum(len(v) for v in vertices), 5))
+
+    return mne.SourceEstimate(data, vertices, tmin=-0.1, tstep=0.01, subject="test")
+
+
+def test_ltc(controller):
+    import numpy as np
+
+    from mne_pipeline_hd.pipeline.loading import MEEG
+
+    controller.pr.parameters[controller.pr.p_preset]["target_labels"] = [
+        "label1-lh",
+        "label2-rh",
+    ]
+    meeg = _create_test_meeg(controller)
+    rng = np.random.default_rng(0)
+    ltcs = {
+        trial: {
+            label: rng.standard_normal((2, 10)) for label in meeg.pa["target_labels"]
+        }
+        for trial in meeg.sel_trials
+    }
+
+    # Round-trip with one HDF5-file for each trial
+    meeg.save_ltc(ltcs)
+    loaded_ltcs = MEEG(meeg.name, controller).load_ltc()
+    for trial in ltcs:
+        for label in ltcs[trial]:
+            np.testing.assert_array_equal(loaded_ltcs[trial][label], ltcs[trial][label])
+
+    # Legacy: Label-Time-Courses stored in one .npy-file for each label
+    for trial in ltcs:
+        os.remove(meeg.ltc_paths[trial])
+        for label, npy_path in meeg.deprecated_paths["ltc_npy"][trial].items():
+            np.save(npy_path, ltcs[trial][label])
+    loaded_ltcs = MEEG(meeg.name, controller).load_ltc()
+    for trial in ltcs:
+        for label in ltcs[trial]:
+            np.testing.assert_array_equal(loaded_ltcs[trial][label], ltcs[trial][label])
+
+
+def test_morphed_source_estimates(controller):
+    import numpy as np
+
+    from mne_pipeline_hd.pipeline.loading import MEEG
+
+    meeg = _create_test_meeg(controller)
+    stcs = {trial: _create_test_stc(idx) for idx, trial in enumerate(meeg.sel_trials)}
+
+    # Round-trip with one HDF5-file for each trial
+    meeg.save_morphed_source_estimates(stcs)
+    for trial in stcs:
+        assert isfile(meeg.morphed_stc_paths[trial])
+    loaded_stcs = MEEG(meeg.name, controller).load_morphed_source_estimates()
+    for trial in stcs:
+        np.testing.assert_array_equal(loaded_stcs[trial].data, stcs[trial].data)
+        for v_loaded, v in zip(loaded_stcs[trial].vertices, stcs[trial].vertices):
+            np.testing.assert_array_equal(v_loaded, v)
+
+    # Legacy: Morphed Source-Estimates stored as .stc-files for each hemisphere
+    for trial in stcs:
+        os.remove(meeg.morphed_stc_paths[trial])
+        stcs[trial].save(meeg.deprecated_paths["stcs_morphed"][trial], ftype="stc")
+    loaded_stcs = MEEG(meeg.name, controller).load_morphed_source_estimates()
+    for trial in stcs:
+        # .stc-files are stored in single precision
+        np.testing.assert_allclose(loaded_stcs[trial].data, stcs[trial].data, rtol=1e-6)
+
+
+def test_load_preload(controller, monkeypatch):
+    import mne
+    import numpy as np
+
+    from mne_pipeline_hd.pipeline import loading
+
+    # Keep loaded data in the data-dict
+    class _QS:
+        def value(self, setting, defaultValue=None):
+            return 0 if setting == "save_ram" else defaultValue
+
+    monkeypatch.setattr(loading, "QS", _QS)
+
+    meeg = _create_test_meeg(controller)
+    info = mne.create_info(["EEG1", "EEG2"], 100.0, "eeg")
+    meeg.save_raw(mne.io.RawArray(np.zeros((2, 100)), info))
+
+    # Data, which wasn't read into memory, is not kept in the data-dict
+    meeg = loading.MEEG(meeg.name, controller)
+    for args, kwargs in [((False,), dict()), (tuple(), {"preload": False})]:
+        raw = meeg.load_raw(*args, **kwargs)
+        assert not raw.preload
+        assert "raw" not in meeg.data_dict
+
+    raw = meeg.load_raw()
+    assert raw.preload
+    assert meeg.data_dict["raw"] is raw
@@ -18,3 +18,40 @@ def test_init(main_window, qtbot):
     _test_wait(qtbot, 1000)
 
     assert _object_refs["main_window"] is None
+
+
+def test_func_group_toggled(main_window):
+    """Group-names like "Forward" exist in several tabs,
+    toggling one group-box must only affect its own functions."""
+    # Build the Compute- and the Plot-tab
+    tab_names = list(main_window.func_tab_funcs)
+    for tab_name in ["Plot", "Compute"]:
+        main_window.tab_func_widget.setCurrentIndex(tab_names.index(tab_name))
+
+    main_window.pr.sel_functions[:] = ["create_forward_solution", "plot_sensors"]
+    main_window.update_selected_funcs()
+
+    compute_forward = [
+        gb for gb in main_window.func_tab_groups["Compute"] if gb.title() == "Forward"
+    ][0]
+    compute_forward.setChecked(False)
+
+    assert "create_forward_solution" not in main_window.pr.sel_functions
+    assert "plot_sensors" in main_window.pr.sel_functions
+
+    compute_forward.setChecked(True)
+
+    assert "create_forward_solution" in main_window.pr.sel_functions
+    assert "plot_sensors" in main_window.pr.sel_functions
+
+
+def test_func_bts_rows(main_window, qtbot):
+    """The function-buttons are arranged for the shown width
+    and no row is left empty."""
+    qtbot.waitExposed(main_window)
+    _test_wait(qtbot, 500)
+
+    assert main_window.func_bts_key[2] == main_window._get_func_bts_width()
+    tab_layout = main_window.tab_func_widget.currentWidget().widget().layout()
+    for row_idx in range(tab_layout.count()):
+        assert tab_layout.itemAt(row_idx).layout().count() > 0